@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import ast
 from datetime import timedelta
 import logging
+import re
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -15,6 +17,14 @@ from .thz_device import THZDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = ["sensor", "number", "switch", "select", "time"]
+
+# Sensor unique_ids used to embed the repr() of the block bytes, e.g.
+# thz_b'\xfb'_4_outside_temp; they now use the hex string (thz_fb_4_...).
+_LEGACY_SENSOR_UNIQUE_ID = re.compile(
+    r"""^thz_(b'(?:[^'\\]|\\.)*'|b"(?:[^"\\]|\\.)*")_(.+)$"""
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up THZ from config entry."""
@@ -36,7 +46,12 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     # 1. Initialize device
     if conn_type == "ip":
-        device = THZDevice(connection="ip", host=data["host"], tcp_port=data["port"])
+        device = THZDevice(
+            connection="ip",
+            host=data["host"],
+            tcp_port=data["port"],
+            socket_options=data.get("socket_options", ()),
+        )
     elif conn_type == "usb":
         device = THZDevice(connection="usb", port=data["device"])
     else:
@@ -109,26 +124,33 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             "Creating coordinators with refresh intervals: %s", refresh_intervals
         )
 
-    # Create a coordinator for each block with its own interval
+    # Blocks polled at the same interval share one coordinator, which reads
+    # them back to back in a single device job per update
+    blocks_by_interval: dict[int, list[str]] = {}
     for block, interval in refresh_intervals.items():
+        blocks_by_interval.setdefault(int(interval), []).append(block)
+
+    for interval, blocks in blocks_by_interval.items():
         _LOGGER.debug(
-            "Creating coordinator for block %s with interval %s seconds",
-            block, interval
+            "Creating coordinator for blocks %s with interval %s seconds",
+            blocks, interval
         )
         coordinator = DataUpdateCoordinator(
             hass,
             _LOGGER,
-            name=f"THZ {block}",
-            update_interval=timedelta(seconds=int(interval)),
-            update_method=lambda b=block: _async_update_block(hass, device, b),
+            name=f"THZ {', '.join(blocks)}",
+            update_interval=timedelta(seconds=interval),
+            update_method=lambda b=blocks: _async_update_blocks(device, b),
         )
         await coordinator.async_config_entry_first_refresh()
         _LOGGER.info(
-            "Initial data fetch completed for block %s, data available: %s",
-            block,
+            "Initial data fetch completed for blocks %s, data available: %s",
+            blocks,
             coordinator.data is not None,
         )
-        coordinators[block] = coordinator
+        # Keyed per block so platforms look up the coordinator of their block
+        for block in blocks:
+            coordinators[block] = coordinator
 
     # Store in hass.data
     hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {
@@ -136,10 +158,11 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         "coordinators": coordinators,
     }
 
+    # Move sensors to the hex block unique_id before the platforms add them
+    await _async_migrate_sensor_unique_ids(hass, config_entry)
+
     # Forward setup to platforms
-    await hass.config_entries.async_forward_entry_setups(
-        config_entry, ["sensor", "number", "switch", "select", "time"]
-    )
+    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     # Re-enable any entities that were previously disabled by the integration
     # This ensures the current code's visibility settings take precedence
@@ -172,6 +195,61 @@ async def _async_cleanup_orphaned_entities(hass: HomeAssistant) -> None:
         )
 
 
+def _migrate_sensor_unique_id(unique_id: str) -> str | None:
+    """Return the current unique_id for a legacy sensor unique_id.
+
+    Args:
+        unique_id: The unique_id stored in the entity registry.
+
+    Returns:
+        The unique_id with the block as hex string, or None if the
+        unique_id does not use the legacy bytes representation.
+    """
+    match = _LEGACY_SENSOR_UNIQUE_ID.match(unique_id)
+    if match is None:
+        return None
+    try:
+        block = ast.literal_eval(match.group(1))
+    except (ValueError, SyntaxError):
+        return None
+    return f"thz_{block.hex()}_{match.group(2)}"
+
+
+async def _async_migrate_sensor_unique_ids(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """Migrate sensor unique_ids that embed the repr() of the block bytes.
+
+    Entities keep their entity_id, history and customizations. An entry is
+    left untouched if an entity with the new unique_id already exists.
+    """
+    entity_reg = er.async_get(hass)
+    migrated_count = 0
+
+    for entity in er.async_entries_for_config_entry(
+        entity_reg, config_entry.entry_id
+    ):
+        if entity.domain != "sensor":
+            continue
+        new_unique_id = _migrate_sensor_unique_id(entity.unique_id)
+        if new_unique_id is None:
+            continue
+        if entity_reg.async_get_entity_id("sensor", DOMAIN, new_unique_id):
+            _LOGGER.warning(
+                "Cannot migrate %s to unique_id %s: already in use",
+                entity.entity_id,
+                new_unique_id,
+            )
+            continue
+        entity_reg.async_update_entity(
+            entity.entity_id, new_unique_id=new_unique_id
+        )
+        migrated_count += 1
+
+    if migrated_count > 0:
+        _LOGGER.info("Migrated unique_id of %d THZ sensors", migrated_count)
+
+
 async def _async_enable_integration_disabled_entities(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> None:
@@ -231,29 +309,36 @@ async def _async_enable_integration_disabled_entities(
         )
 
 
-async def _async_update_block(hass: HomeAssistant, device: THZDevice, block_name: str):
-    """Called by coordinator to read a data block."""
-    block_bytes = bytes.fromhex(block_name.removeprefix("pxx"))
+async def _async_update_blocks(
+    device: THZDevice, block_names: list[str]
+) -> dict[bytes, bytes | None]:
+    """Called by coordinator to read its data blocks.
+
+    Returns the payload per block address; blocks that could not be read
+    map to None. Fails the update only when no block could be read.
+    """
+    block_list = [bytes.fromhex(name.removeprefix("pxx")) for name in block_names]
     try:
-        _LOGGER.debug("Reading block %s", block_name)
-        async with device.lock:
-            return await hass.async_add_executor_job(device.read_block, block_bytes, "get")
+        _LOGGER.debug("Reading blocks %s", block_names)
+        async with device.async_exclusive():
+            payloads = await device.async_run(device.read_blocks, block_list)
     except Exception as err:
-        raise UpdateFailed(f"Error reading {block_name}: {err}") from err
+        raise UpdateFailed(f"Error reading {block_names}: {err}") from err
+    if not any(payload is not None for payload in payloads.values()):
+        raise UpdateFailed(f"Error reading {block_names}: no block could be read")
+    return payloads
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Remove Config Entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(
-        entry, ["sensor", "select", "number", "time", "switch"]
-    )
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         # Clean up device connection
         entry_data = hass.data[DOMAIN].get(entry.entry_id)
         if entry_data:
             device = entry_data.get("device")
             if device:
-                await hass.async_add_executor_job(device.close)
+                await device.async_close()
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
 
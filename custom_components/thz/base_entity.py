@@ -2,17 +2,30 @@
 
 This module provides base classes for THZ entities to reduce code duplication
 across entity platforms (number, switch, select, time).
+
+Write entities do not poll. Each platform reads the registers of all its
+entities through one DataUpdateCoordinator whose update interval is the
+"write_interval" of the config entry (see platform_setup).
 """
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import logging
-from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 
-from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN, should_hide_entity_by_default
+from .const import (
+    DOMAIN,
+    entity_slug,
+    should_hide_entity_by_default,
+)
 
 if TYPE_CHECKING:
     from .thz_device import THZDevice
@@ -27,7 +40,6 @@ class THZBaseEntity(Entity):
     across all THZ entity types that communicate with write registers.
     """
 
-    _attr_should_poll = True
     def __init__(
         self,
         name: str,
@@ -36,7 +48,6 @@ class THZBaseEntity(Entity):
         device_id: str,
         icon: str | None = None,
         unique_id: str | None = None,
-        scan_interval: int | None = None,
         translation_key: str | None = None,
     ) -> None:
         """Initialize base THZ entity.
@@ -48,13 +59,18 @@ class THZBaseEntity(Entity):
             device_id: The device identifier for registry linking.
             icon: Optional icon override (defaults to "mdi:eye").
             unique_id: Optional unique ID (auto-generated if not provided).
-            scan_interval: Update interval in seconds (uses DEFAULT_UPDATE_INTERVAL if not provided).
             translation_key: Optional translation key for localization.
         """
         self._command = command
+        # Decode the constant command once instead of on every poll/write
+        self._command_bytes = bytes.fromhex(command)
         self._device = device
         self._device_id = device_id
         self._attr_icon = icon or "mdi:eye"
+        # Link to the device; constant, so built once instead of per access
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
 
         # Per Home Assistant documentation, has_entity_name=True is MANDATORY for new integrations.
         # See: https://developers.home-assistant.io/docs/core/entity/#entity-naming
@@ -83,10 +99,6 @@ class THZBaseEntity(Entity):
             getattr(self, '_attr_translation_key', None)
         )
 
-        # Configure update interval
-        interval = scan_interval if scan_interval is not None else DEFAULT_UPDATE_INTERVAL
-        self.SCAN_INTERVAL = timedelta(seconds=interval)
-
         # Set default visibility based on entity naming conventions
         self._attr_entity_registry_enabled_default = not should_hide_entity_by_default(name)
 
@@ -100,7 +112,7 @@ class THZBaseEntity(Entity):
         Returns:
             A unique identifier string.
         """
-        return f"thz_set_{command.lower()}_{name.lower().replace(' ', '_')}"
+        return f"thz_set_{command.lower()}_{entity_slug(name)}"
 
     # No property overrides needed!
     # Home Assistant uses ONLY the _attr_* attributes for translation:
@@ -116,9 +128,43 @@ class THZBaseEntity(Entity):
         """Return if the entity should be enabled when first added to the registry."""
         return self._attr_entity_registry_enabled_default
 
-    @property
-    def device_info(self):
-        """Return device information to link this entity with the device."""
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-        }
+
+class THZCoordinatorEntity(CoordinatorEntity, THZBaseEntity, ABC):
+    """Base class for THZ write entities updated by a platform coordinator.
+
+    The coordinator data maps register command bytes to the bytes read for
+    that register (None when the read failed). Subclasses decode their own
+    register in _update_from_coordinator.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: DataUpdateCoordinator, **kwargs) -> None:
+        """Initialize a coordinator-updated THZ entity.
+
+        Args:
+            coordinator: The coordinator reading the platform's registers.
+            **kwargs: Passed on to THZBaseEntity.
+        """
+        CoordinatorEntity.__init__(self, coordinator)
+        THZBaseEntity.__init__(self, **kwargs)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the state from the coordinator and write it to HA."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    async def async_added_to_hass(self) -> None:
+        """Take the initial state from the first coordinator refresh."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._update_from_coordinator()
+
+    def _register_bytes(self) -> bytes | None:
+        """Return the bytes last read for this entity's register, if any."""
+        return (self.coordinator.data or {}).get(self._command_bytes)
+
+    @abstractmethod
+    def _update_from_coordinator(self) -> None:
+        """Decode this entity's state from the latest coordinator data."""
@@ -4,7 +4,6 @@ This module provides calendar entities that visualize heating program schedules
 (DHW, HC1, HC2, FAN) as recurring calendar events in Home Assistant.
 """
 
-import asyncio
 from datetime import datetime, time, timedelta
 import logging
 
@@ -16,7 +15,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import should_hide_entity_by_default
+from .const import entity_slug, should_hide_entity_by_default
 from .register_maps.register_map_manager import RegisterMapManagerWrite
 from .thz_device import THZDevice
 from .time import quarters_to_time
@@ -73,7 +72,7 @@ async def async_setup_entry(
                 command=entry["command"],
                 device=device,
                 icon=entry.get("icon"),
-                unique_id=f"thz_{name.lower().replace(' ', '_')}",
+                unique_id=f"thz_{entity_slug(name)}",
                 start_time=None,
                 end_time=None,
             )
@@ -169,7 +168,7 @@ class THZSchedule:
         self._start_time = start_time
         self._end_time = end_time
         self._icon = icon or "mdi:clock"
-        unique_suffix = name.lower().replace(' ', '_')
+        unique_suffix = entity_slug(name)
         self._attr_unique_id = (
             unique_id or f"thz_time_{command.lower()}_{unique_suffix}"
         )
@@ -217,11 +216,10 @@ class THZSchedule:
     async def get_schedule_times_from_device(self) -> tuple[time | None, time | None]:
         """Retrieve schedule times from the device for this entity's day."""
         try:
-            async with self._device.lock:
-                raw_value = self._device.read_value(
-                    bytes.fromhex(self._command), "get", 4, 4
+            async with self._device.async_exclusive():
+                raw_value = await self._device.async_run(
+                    self._device.read_value, bytes.fromhex(self._command), "get", 4, 4
                 )
-                await asyncio.sleep(0.01)  # Short pause for device readiness
 
             _LOGGER.debug(
                 "%s: raw_value=%s",
@@ -300,6 +300,7 @@ class THZConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Dynamically read available blocks from the heat pump."""
         data = self.connection_data
         conn_type = data["connection_type"]
+        device: THZDevice | None = None
 
         try:
 
@@ -318,7 +319,7 @@ class THZConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     baudrate=data.get("baudrate", DEFAULT_BAUDRATE),
                 )
 
-            device: THZDevice = await self.hass.async_add_executor_job(
+            device = await self.hass.async_add_executor_job(
                 create_and_init_device
             )
 
@@ -334,6 +335,12 @@ class THZConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.exception("Error reading firmware/blocks")
             return self.async_abort(reason="cannot_detect_blocks")
 
+        finally:
+            # Release the connection and the device's I/O thread, also when
+            # the detection failed
+            if device is not None:
+                await device.async_close()
+
         self.blocks = blocks
         self.connection_data["firmware"] = firmware
         return await self.async_step_refresh_blocks()
@@ -18,6 +18,8 @@ Constants:
     DEFAULT_UPDATE_INTERVAL: Default update interval in seconds.
 """
 
+from functools import lru_cache
+
 DOMAIN = "thz"
 SERIAL_PORT = "/dev/ttyUSB0"
 TIMEOUT = 1
@@ -40,6 +42,22 @@ WRITE_REGISTER_LENGTH = 2  # Number of bytes for most write parameters
 TIME_VALUE_UNSET = 0x80  # Sentinel value (128) indicating "no time" is set
 
 
+@lru_cache(maxsize=None)
+def entity_slug(entity_name: str) -> str:
+    """Return the slug of an entity name used in unique IDs.
+
+    Names are bounded by the register maps, so results are cached and
+    shared by all platforms building IDs from the same names.
+
+    Args:
+        entity_name: The entity name, e.g. "programDHW Mo".
+
+    Returns:
+        The lower-cased name with spaces replaced by underscores.
+    """
+    return entity_name.lower().replace(" ", "_")
+
+
 def should_hide_entity_by_default(entity_name: str) -> bool:
     """Determine if an entity should be hidden by default.
 
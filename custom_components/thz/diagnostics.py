@@ -42,11 +42,15 @@ async def async_get_config_entry_diagnostics(
     # Collect coordinator information (without sensitive data)
     coordinator_info = {}
     for block_name, coordinator in coordinators.items():
+        # Coordinators hold the payloads of all blocks sharing their interval
+        payload = (coordinator.data or {}).get(
+            bytes.fromhex(block_name.removeprefix("pxx"))
+        )
         coordinator_info[block_name] = {
             "last_update_success": coordinator.last_update_success,
             "last_update_time": str(coordinator.last_update_success_time) if coordinator.last_update_success_time else None,
             "update_interval": str(coordinator.update_interval) if coordinator.update_interval else None,
-            "data_length": len(coordinator.data) if coordinator.data else 0,
+            "data_length": len(payload) if payload else 0,
         }
 
     # Collect register information (counts only, no data)
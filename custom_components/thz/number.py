@@ -1,15 +1,15 @@
 """THZ Number Entity Platform."""
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .base_entity import THZBaseEntity
+from .base_entity import THZCoordinatorEntity
 from .entity_translations import get_translation_key
 from .const import (
     WRITE_REGISTER_OFFSET,
@@ -29,12 +29,22 @@ async def async_setup_entry(
 ) -> None:
     """Set up THZ number entities from config entry."""
     await async_setup_write_platform(
-        hass, config_entry, async_add_entities, THZNumber, "number"
+        hass,
+        config_entry,
+        async_add_entities,
+        THZNumber,
+        "number",
+        offset=WRITE_REGISTER_OFFSET,
+        length=WRITE_REGISTER_LENGTH,
     )
 
 
-class THZNumber(THZBaseEntity, NumberEntity):
-    """Representation of a THZ Number entity."""
+class THZNumber(THZCoordinatorEntity, NumberEntity):
+    """Representation of a THZ Number entity.
+
+    The value is read by the shared number coordinator created in
+    async_setup_write_platform; the entity does not poll on its own.
+    """
 
     def __init__(
         self,
@@ -42,7 +52,7 @@ class THZNumber(THZBaseEntity, NumberEntity):
         entry: dict,
         device: THZDevice,
         device_id: str,
-        scan_interval: int | None = None,
+        coordinator: DataUpdateCoordinator,
     ) -> None:
         """Initialize a THZ number entity.
 
@@ -51,16 +61,16 @@ class THZNumber(THZBaseEntity, NumberEntity):
             entry: The register entry dict containing configuration.
             device: The device instance this entity belongs to.
             device_id: The device identifier for linking to device.
-            scan_interval: The scan interval in seconds for polling updates.
+            coordinator: The coordinator reading all number registers.
         """
         # Initialize base class with common properties
         super().__init__(
+            coordinator,
             name=name,
             command=entry["command"],
             device=device,
             device_id=device_id,
             icon=entry.get("icon"),
-            scan_interval=scan_interval,
             translation_key=get_translation_key(name),
         )
 
@@ -83,16 +93,9 @@ class THZNumber(THZBaseEntity, NumberEntity):
         """Return the native value of the number."""
         return self._attr_native_value
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the number."""
-        async with self._device.lock:
-            value_bytes = await self.hass.async_add_executor_job(
-                self._device.read_value,
-                bytes.fromhex(self._command),
-                "get",
-                WRITE_REGISTER_OFFSET,
-                WRITE_REGISTER_LENGTH,
-            )
+    def _update_from_coordinator(self) -> None:
+        """Decode this number's value from the latest coordinator data."""
+        value_bytes = self._register_bytes()
 
         # Validate that we received data
         if not value_bytes:
@@ -130,16 +133,15 @@ class THZNumber(THZBaseEntity, NumberEntity):
                 self._decode_type
             )
 
-            async with self._device.lock:
-                await self.hass.async_add_executor_job(
+            async with self._device.async_exclusive():
+                await self._device.async_run(
                     self._device.write_value,
-                    bytes.fromhex(self._command),
+                    self._command_bytes,
                     value_bytes,
                 )
-                # Short pause to ensure the device is ready
-                await asyncio.sleep(0.01)
 
             self._attr_native_value = value
+            self.async_write_ha_state()
         except (ValueError, TypeError) as err:
             _LOGGER.error(
                 "Error encoding number %s value %s: %s",
@@ -7,9 +7,17 @@ across entity platforms.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Callable
+from datetime import timedelta
+from typing import TYPE_CHECKING
 
-from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    WRITE_REGISTER_LENGTH,
+    WRITE_REGISTER_OFFSET,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -28,12 +36,15 @@ async def async_setup_write_platform(
     async_add_entities: AddEntitiesCallback,
     entity_type: type,
     platform_type: str,
-    entity_factory: Callable | None = None,
+    offset: int = WRITE_REGISTER_OFFSET,
+    length: int = WRITE_REGISTER_LENGTH,
 ) -> None:
     """Generic setup for write platforms (number, switch, select, time).
 
     This function consolidates the common setup logic used by all write-based
-    entity platforms, reducing code duplication.
+    entity platforms, reducing code duplication. The platform's registers are
+    read by one coordinator that refreshes every "write_interval" seconds;
+    registers marked "write_only" are not read back.
 
     Args:
         hass: The Home Assistant instance.
@@ -41,49 +52,123 @@ async def async_setup_write_platform(
         async_add_entities: Callback function to register new entities.
         entity_type: The entity class to instantiate (e.g., THZNumber, THZSwitch).
         platform_type: The type filter for register entries (e.g., "number", "switch").
-        entity_factory: Optional custom factory function for creating entities.
-                       If provided, called with (name, entry, device, device_id, write_interval)
-                       and should return a list of entities.
+        offset: Byte offset of the value in each register response.
+        length: Number of value bytes in each register response.
     """
     write_manager: RegisterMapManagerWrite = hass.data[DOMAIN]["write_manager"]
     device: THZDevice = hass.data[DOMAIN]["device"]
-    device_id = hass.data[DOMAIN]["device_id"]
-
-    # Get write interval from config, default to DEFAULT_UPDATE_INTERVAL
     write_interval = config_entry.data.get("write_interval", DEFAULT_UPDATE_INTERVAL)
 
-    write_registers = write_manager.get_all_registers()
-    _LOGGER.debug(
-        "Loading %s platform with %d registers", platform_type, len(write_registers)
+    registers = write_manager.get_registers_by_type(platform_type)
+    # Each register once, and only those that can be read back
+    commands = list(
+        dict.fromkeys(
+            bytes.fromhex(entry["command"])
+            for entry in registers.values()
+            if not entry.get("write_only", False)
+        )
+    )
+    coordinator = create_write_coordinator(
+        hass, device, f"THZ {platform_type}", write_interval, commands, offset, length
     )
 
-    entities = []
-    for name, entry in write_registers.items():
-        if entry["type"] == platform_type:
-            _LOGGER.debug(
-                "Creating %s for %s with command %s",
-                entity_type.__name__,
-                name,
-                entry["command"]
+    entities = create_write_entities(hass, entity_type, platform_type, coordinator)
+    if entities:
+        await coordinator.async_refresh()
+    async_add_entities(entities)
+
+
+def create_write_coordinator(
+    hass: HomeAssistant,
+    device: THZDevice,
+    name: str,
+    write_interval: int,
+    commands: list[bytes],
+    offset: int = WRITE_REGISTER_OFFSET,
+    length: int = WRITE_REGISTER_LENGTH,
+) -> DataUpdateCoordinator:
+    """Create a coordinator reading a fixed list of registers.
+
+    All registers are read back to back under a single device lock hold
+    per update interval.
+
+    Args:
+        hass: The Home Assistant instance.
+        device: The THZ device to read from.
+        name: The coordinator name used in logs.
+        write_interval: The update interval in seconds.
+        commands: The register command bytes to read.
+        offset: Byte offset of the value in each register response.
+        length: Number of value bytes in each register response.
+
+    Returns:
+        The coordinator; its data maps command bytes to the value bytes,
+        or None for reads that failed.
+    """
+
+    async def _async_update() -> dict[bytes, bytes | None]:
+        if not commands:
+            # Nothing to read back (e.g. only write-only registers)
+            return {}
+        async with device.async_exclusive():
+            return await device.async_run(
+                device.read_values, commands, "get", offset, length
             )
 
-            # Use custom factory if provided, otherwise use default
-            if entity_factory:
-                new_entities = entity_factory(name, entry, device, device_id, write_interval)
-                entities.extend(new_entities if isinstance(new_entities, list) else [new_entities])
-            else:
-                # Create entity instance with common parameters
-                entity = entity_type(
-                    name=name,
-                    entry=entry,
-                    device=device,
-                    device_id=device_id,
-                    scan_interval=write_interval,
-                )
-                entities.append(entity)
+    return DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=name,
+        update_interval=timedelta(seconds=int(write_interval)),
+        update_method=_async_update,
+    )
+
+
+def create_write_entities(
+    hass: HomeAssistant,
+    entity_type: type,
+    platform_type: str,
+    coordinator: DataUpdateCoordinator,
+) -> list:
+    """Create the entities of a write platform without adding them.
+
+    Args:
+        hass: The Home Assistant instance.
+        entity_type: The entity class to instantiate (e.g., THZNumber, THZSwitch).
+        platform_type: The type filter for register entries (e.g., "number", "switch").
+        coordinator: The coordinator reading the platform's registers, passed
+                     to every entity.
+
+    Returns:
+        The created entities.
+    """
+    write_manager: RegisterMapManagerWrite = hass.data[DOMAIN]["write_manager"]
+    device: THZDevice = hass.data[DOMAIN]["device"]
+    device_id = hass.data[DOMAIN]["device_id"]
+
+    # Only the registers of this platform's type, grouped once at load time
+    registers = write_manager.get_registers_by_type(platform_type)
+    _LOGGER.debug(
+        "Creating %d %s entities for %s registers",
+        len(registers),
+        entity_type.__name__,
+        platform_type,
+    )
+
+    # Create entity instances with common parameters
+    entities = [
+        entity_type(
+            name=name,
+            entry=entry,
+            device=device,
+            device_id=device_id,
+            coordinator=coordinator,
+        )
+        for name, entry in registers.items()
+    ]
 
     _LOGGER.info("Created %d %s entities", len(entities), platform_type)
-    async_add_entities(entities, True)
+    return entities
 
 
 def get_device_from_hass(hass: HomeAssistant) -> THZDevice:
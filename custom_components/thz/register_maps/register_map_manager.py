@@ -1,6 +1,7 @@
 """THZ Register Map Manager."""
 
 from copy import deepcopy
+from dataclasses import dataclass
 import logging
 import sys
 from typing import Any
@@ -63,6 +64,50 @@ FIRMWARE_MAPS = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class SensorField:
+    """A read register entry normalized for decoding.
+
+    Read maps give offsets and lengths in hex characters (nibbles); the
+    field holds them in bytes, and the name without whitespace or a
+    trailing colon.
+    """
+
+    name: str
+    offset: int
+    length: int
+    decode: str
+    factor: float
+
+
+def build_sensor_fields(
+    registers: dict[str, list],
+) -> dict[str, tuple[SensorField, ...]]:
+    """Normalize read register entries into SensorField tuples per block.
+
+    Args:
+        registers: Mapping of block name to (name, offset, length, decode,
+            factor) entries, with offset and length in hex characters.
+
+    Returns:
+        Mapping of block name to its normalized fields, in map order.
+    """
+    return {
+        block: tuple(
+            SensorField(
+                name=name.strip().rstrip(":"),
+                offset=offset // 2,
+                # +1 to always have at least one byte
+                length=(length + 1) // 2,
+                decode=decode,
+                factor=factor,
+            )
+            for name, offset, length, decode, factor in entries
+        )
+        for block, entries in registers.items()
+    }
+
+
 class BaseRegisterMapManager:
     """Manages register maps for different firmware versions."""
 
@@ -197,6 +242,11 @@ class RegisterMapManager(BaseRegisterMapManager):
             map_attr="REGISTER_MAP",
             entry_type=list,
         )
+        self._sensor_fields = build_sensor_fields(self._merged_map)
+
+    def get_sensor_fields(self) -> dict[str, tuple[SensorField, ...]]:
+        """Get the merged read registers normalized once at load time."""
+        return self._sensor_fields
 
 
 class RegisterMapManagerWrite(BaseRegisterMapManager):
@@ -211,6 +261,14 @@ class RegisterMapManagerWrite(BaseRegisterMapManager):
             map_attr="WRITE_MAP",
             entry_type=dict,
         )
+        # Group once so each platform only sees the registers of its type
+        self._registers_by_type: dict[str, dict[str, dict]] = {}
+        for name, entry in self._merged_map.items():
+            self._registers_by_type.setdefault(entry.get("type"), {})[name] = entry
+
+    def get_registers_by_type(self, register_type: str) -> dict[str, dict]:
+        """Get the write registers of one type (e.g. "switch"), in map order."""
+        return self._registers_by_type.get(register_type, {})
 
     def _merge_maps(self, base: dict, override: dict) -> dict:
         """For write maps prefer a simple dict update behaviour."""
@@ -50,6 +50,11 @@ Each parameter metadata dictionary contains the following keys:
   map decode_type tokens to concrete serialization/deserialization logic (scaling,
   byte length, signed/unsigned, enumeration handling, etc.).
 
+- write_only : bool
+  Optional; only meaningful for "switch" entries. When true the register is
+  never read back: the switch is not polled and its state is the last value
+  written from Home Assistant.
+
 Operational notes
 -----------------
 - Numeric min/max are stored as strings to keep the map serializable; callers must
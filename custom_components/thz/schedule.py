@@ -1,6 +1,5 @@
 """Schedule entity for THZ devices."""
 
-import asyncio
 from dataclasses import dataclass
 from datetime import time, timedelta
 import logging
@@ -10,6 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .const import entity_slug
 from .register_maps.register_map_manager import RegisterMapManagerWrite
 from .thz_device import THZDevice
 from .time import quarters_to_time, time_to_quarters
@@ -67,7 +67,7 @@ async def async_setup_entry(
                 command=entry["command"],
                 device=device,
                 icon=entry.get("icon"),
-                unique_id=f"thz_{name.lower().replace(' ', '_')}",
+                unique_id=f"thz_{entity_slug(name)}",
             )
             entities.append(entity)
 
@@ -112,7 +112,7 @@ class THZSchedule(Schedule):
         self.day_index = self._parse_day_from_name(name)  # e.g., 4 for Friday
         self._device = device
         self._attr_icon = icon or "mdi:clock"
-        unique_suffix = name.lower().replace(' ', '_')
+        unique_suffix = entity_slug(name)
         self._attr_unique_id = (
             unique_id or f"thz_time_{command.lower()}_{unique_suffix}"
         )
@@ -149,17 +149,14 @@ class THZSchedule(Schedule):
 
     async def get_schedule_times_from_device(self) -> list[ScheduleInfo]:
         """Retrieve schedule times from the device for this entity's day."""
-        async with self._device.lock:
-            raw_value = await self.hass.async_add_executor_job(
+        async with self._device.async_exclusive():
+            raw_value = await self._device.async_run(
                 self._device.read_value,
                 bytes.fromhex(self._command),
                 "get",
                 4,
                 4
             )
-            await asyncio.sleep(
-                0.01
-            )  # Short pause to ensure the device is ready
 
         # Schedule data format (from FHEM 7prog):
         # - raw_value[0]: start time (1 byte, 0-95 quarters)
@@ -181,8 +178,8 @@ class THZSchedule(Schedule):
                 # Handle empty schedule (e.g., clear the slot)
                 empty_time = time_to_quarters(None)
                 # Read current data to preserve other bytes
-                async with self._device.lock:
-                    current_bytes = await self.hass.async_add_executor_job(
+                async with self._device.async_exclusive():
+                    current_bytes = await self._device.async_run(
                         self._device.read_value,
                         bytes.fromhex(self._command),
                         "get",
@@ -193,8 +190,8 @@ class THZSchedule(Schedule):
                 new_bytes = bytearray(current_bytes)
                 new_bytes[0] = empty_time
                 new_bytes[1] = empty_time
-                async with self._device.lock:
-                    await self.hass.async_add_executor_job(
+                async with self._device.async_exclusive():
+                    await self._device.async_run(
                         self._device.write_value,
                         bytes.fromhex(self._command),
                         bytes(new_bytes),
@@ -207,8 +204,8 @@ class THZSchedule(Schedule):
             end_time_quarters = time_to_quarters(end_time)
 
             # Read current data to preserve other bytes
-            async with self._device.lock:
-                current_bytes = await self.hass.async_add_executor_job(
+            async with self._device.async_exclusive():
+                current_bytes = await self._device.async_run(
                     self._device.read_value,
                     bytes.fromhex(self._command),
                     "get",
@@ -221,8 +218,8 @@ class THZSchedule(Schedule):
             new_bytes[0] = start_time_quarters
             new_bytes[1] = end_time_quarters
 
-            async with self._device.lock:
-                await self.hass.async_add_executor_job(
+            async with self._device.async_exclusive():
+                await self._device.async_run(
                     self._device.write_value,
                     bytes.fromhex(self._command),
                     bytes(new_bytes),
@@ -1,15 +1,15 @@
 """Select entity for THZ integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .base_entity import THZBaseEntity
+from .base_entity import THZCoordinatorEntity
 from .entity_translations import get_translation_key
 from .const import (
     WRITE_REGISTER_OFFSET,
@@ -30,14 +30,24 @@ async def async_setup_entry(
 ) -> None:
     """Create THZSelect entities."""
     await async_setup_write_platform(
-        hass, config_entry, async_add_entities, THZSelect, "select"
+        hass,
+        config_entry,
+        async_add_entities,
+        THZSelect,
+        "select",
+        offset=WRITE_REGISTER_OFFSET,
+        length=WRITE_REGISTER_LENGTH,
     )
 
 
 
 
-class THZSelect(THZBaseEntity, SelectEntity):
-    """Representation of a THZ Select entity."""
+class THZSelect(THZCoordinatorEntity, SelectEntity):
+    """Representation of a THZ Select entity.
+
+    The option is read by the shared select coordinator created in
+    async_setup_write_platform; the entity does not poll on its own.
+    """
 
     def __init__(
         self,
@@ -45,7 +55,7 @@ class THZSelect(THZBaseEntity, SelectEntity):
         entry: dict,
         device: THZDevice,
         device_id: str,
-        scan_interval: int | None = None,
+        coordinator: DataUpdateCoordinator,
     ) -> None:
         """Initialize a THZ select entity.
 
@@ -54,16 +64,16 @@ class THZSelect(THZBaseEntity, SelectEntity):
             entry: The register entry dict containing configuration.
             device: The device instance this select entity belongs to.
             device_id: The device identifier for linking to device.
-            scan_interval: The scan interval in seconds for polling updates.
+            coordinator: The coordinator reading all select registers.
         """
         # Initialize base class with common properties
         super().__init__(
+            coordinator,
             name=name,
             command=entry.get("command"),
             device=device,
             device_id=device_id,
             icon=entry.get("icon"),
-            scan_interval=scan_interval,
             translation_key=get_translation_key(name),
         )
 
@@ -90,16 +100,9 @@ class THZSelect(THZBaseEntity, SelectEntity):
         """Return the current option."""
         return self._attr_current_option
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the select."""
-        async with self._device.lock:
-            value_bytes = await self.hass.async_add_executor_job(
-                self._device.read_value,
-                bytes.fromhex(self._command),
-                "get",
-                WRITE_REGISTER_OFFSET,
-                WRITE_REGISTER_LENGTH,
-            )
+    def _update_from_coordinator(self) -> None:
+        """Decode this select's option from the latest coordinator data."""
+        value_bytes = self._register_bytes()
 
         # Validate that we received data
         if not value_bytes:
@@ -141,16 +144,15 @@ class THZSelect(THZBaseEntity, SelectEntity):
             value_bytes = THZValueCodec.encode_select(option, self._decode_type)
             _LOGGER.debug("Encoded value bytes: %s", value_bytes.hex())
 
-            async with self._device.lock:
-                await self.hass.async_add_executor_job(
+            async with self._device.async_exclusive():
+                await self._device.async_run(
                     self._device.write_value,
-                    bytes.fromhex(self._command),
+                    self._command_bytes,
                     value_bytes,
                 )
-                # Short pause to ensure the device is ready
-                await asyncio.sleep(0.01)
 
             self._attr_current_option = option
+            self.async_write_ha_state()
         except (ValueError, TypeError) as err:
             _LOGGER.error(
                 "Error encoding select %s to option %s: %s",
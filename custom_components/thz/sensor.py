@@ -1,357 +1,555 @@
-# custom_components/thz/sensor.py
-"""THZ Sensor Platform for Home Assistant.
-
-This module provides the sensor platform for the THZ integration in Home Assistant.
-It defines the setup routine for sensor entities, decoding logic for raw sensor
-data, and a generic sensor entity class for representing THZ device sensors.
-
-Key Components:
-    - async_setup_entry: Asynchronous setup for THZ sensor entities.
-    - decode_value: Utility function to decode raw bytes from the device.
-    - normalize_entry: Helper to standardize sensor entry definitions.
-    - THZGenericSensor: Entity class representing a generic THZ sensor.
-
-The integration reads register mappings from the THZ device, decodes sensor
-values according to their metadata, and exposes them as HA sensor entities.
-"""
-from __future__ import annotations
-
-import logging
-import struct
-
-from homeassistant.components.sensor import (
-    SensorDeviceClass,
-    SensorEntity,
-    SensorStateClass,
-)
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import DOMAIN, should_hide_entity_by_default
-from .register_maps.register_map_manager import RegisterMapManager
-from .sensor_meta import SENSOR_META
-
-_LOGGER = logging.getLogger(__name__)
-
-
-async def async_setup_entry(
-    hass: HomeAssistant,
-    config_entry: ConfigEntry,
-    async_add_entities: AddConfigEntryEntitiesCallback,
-) -> None:
-    """Set up THZ sensor entities from a config entry.
-
-    This function initializes sensor entities for the THZ integration by
-    retrieving register mappings, creating sensor metadata, and adding
-    the entities to Home Assistant.
-
-    Args:
-        hass: The Home Assistant instance.
-        config_entry: The configuration entry for this integration.
-        async_add_entities: Callback to add entities to Home Assistant.
-
-    Returns:
-        None
-    """
-    # Get data from hass.data
-    register_manager: RegisterMapManager = hass.data[DOMAIN]["register_manager"]
-    entry_data = hass.data[DOMAIN][config_entry.entry_id]
-    coordinators = entry_data["coordinators"]
-    device_id = hass.data[DOMAIN]["device_id"]
-
-    # Create sensors
-    sensors = []
-    seen_sensor_names = set()  # Track sensor names to avoid duplicates
-    all_registers = register_manager.get_all_registers()
-    for block, entries in all_registers.items():
-        # Get the coordinator for this block
-        coordinator = coordinators.get(block)
-        if coordinator is None:
-            _LOGGER.warning(
-                "No coordinator found for block %s, skipping sensors", block
-            )
-            continue
-
-        block_hex = block.removeprefix("pxx")  # Remove "pxx" prefix
-        block_bytes = bytes.fromhex(block_hex)
-        for name, offset, length, decode_type, factor in entries:
-            # Strip whitespace and trailing colons from sensor name
-            sensor_name = name.strip().rstrip(':')
-
-            # Skip duplicate sensor names - only create the first occurrence
-            if sensor_name in seen_sensor_names:
-                _LOGGER.debug(
-                    "Skipping duplicate sensor '%s' in block %s (already created)",
-                    sensor_name,
-                    block,
-                )
-                continue
-
-            seen_sensor_names.add(sensor_name)
-
-            meta = SENSOR_META.get(sensor_name, {})
-            entry = {
-                "name": sensor_name,
-                "offset": offset // 2,  # Register offset in bytes
-                "length": (length + 1)
-                // 2,  # Register length in bytes; +1 to always have >=1 byte
-                "decode": decode_type,
-                "factor": factor,
-                "unit": meta.get("unit"),
-                "device_class": meta.get("device_class"),
-                "state_class": meta.get("state_class"),
-                "icon": meta.get("icon"),
-                "translation_key": meta.get("translation_key"),
-            }
-            sensors.append(
-                THZGenericSensor(
-                    coordinator, entry=entry, block=block_bytes, device_id=device_id
-                )
-            )
-    async_add_entities(sensors, True)
-
-
-def decode_value(
-    raw: bytes, decode_type: str, factor: float = 1.0
-) -> int | float | bool | str:
-    """Decode a raw byte value according to the specified decode type.
-
-    Args:
-        raw: The raw bytes to decode.
-        decode_type: The type of decoding to apply. Supported types:
-            - "hex2int": Signed integer divided by factor.
-            - "hex": Unsigned integer.
-            - "bitX": Extracts bit number X (e.g., "bit3").
-            - "nbitX": Negation of bit X (e.g., "nbit2").
-            - "esp_mant": Mantissa and exponent representation.
-            - Any other: Returns hexadecimal representation.
-        factor: The divisor for "hex2int" decoding. Defaults to 1.0.
-
-    Returns:
-        The decoded value (int, float, bool, or str).
-    """
-    if decode_type == "hex2int":
-        # Only use 2 bytes; register indicates 4 chars in hex string
-        return int.from_bytes(raw, byteorder="big", signed=True) / factor
-    if decode_type == "hex":
-        # Only use 2 bytes; register indicates 4 chars in hex string
-        return int.from_bytes(raw, byteorder="big")
-    if decode_type.startswith("bit"):
-        bitnum = int(decode_type[3:])
-        return bool((raw[0] >> bitnum) & 0x01)
-    if decode_type.startswith("nbit"):
-        bitnum = int(decode_type[4:])
-        return not bool((raw[0] >> bitnum) & 0x01)
-    if decode_type == "esp_mant":
-        # FHEM code reverses bytes and unpacks, equivalent to big-endian
-        mant = struct.unpack('>f', raw)[0]
-        return round(mant, 3)
-
-    return raw.hex()
-
-
-def normalize_entry(entry):
-    """Normalize a sensor entry to a standard dictionary format.
-
-    This function accepts either a tuple or a dictionary representing a
-    sensor entry. If a tuple is provided, it is unpacked into a dictionary
-    with predefined keys. If a dictionary is provided, it is returned as-is.
-
-    Args:
-        entry: The sensor entry to normalize. If a tuple, it should contain
-            (name, offset, length, decode, factor).
-
-    Returns:
-        A dictionary containing the normalized sensor entry.
-
-    Raises:
-        ValueError: If the entry is not a tuple or dictionary.
-    """
-    if isinstance(entry, tuple):
-        name, offset, length, decode, factor = entry
-        return {
-            "name": name.strip(),
-            "offset": offset,
-            "length": length,
-            "decode": decode,
-            "factor": factor,
-            "unit": None,
-            "device_class": None,
-            "state_class": None,
-            "icon": None,
-            "translation_key": None,
-        }
-    if isinstance(entry, dict):
-        return entry
-
-    raise ValueError("Unsupported sensor entry format.")
-
-
-class THZGenericSensor(CoordinatorEntity, SensorEntity):
-    """Represents a generic sensor entity for the THZ integration.
-
-    This class is responsible for managing the state and properties of a
-    sensor associated with a THZ device. It uses a coordinator to poll data
-    from the device at configurable intervals, then decodes the relevant
-    bytes for this sensor.
-
-    Attributes:
-        _block: Block identifier associated with the sensor.
-        _offset: Offset within the block for sensor data.
-        _length: Length of the sensor data in bytes.
-        _decode_type: Type used to decode the sensor data.
-        _factor: Factor to apply to the decoded value.
-        _entity_name: Internal name used for logging and unique_id.
-        _unit: Unit of measurement for the sensor.
-        _device_class: Device class for the sensor.
-        _icon: Icon representing the sensor.
-
-    Note:
-        Translation is handled via _attr_translation_key when available.
-        Setting _attr_name blocks translation, so we only set it when
-        no translation is available.
-    """
-
-    def __init__(self, coordinator, entry, block, device_id) -> None:
-        """Initialize a sensor instance with the provided configuration.
-
-        Args:
-            coordinator: The DataUpdateCoordinator for this sensor's block.
-            entry: The configuration entry dict for the sensor.
-            block: The block associated with the sensor.
-            device_id: The unique device identifier.
-
-        Note:
-            When translation_key is available, only _attr_translation_key is set.
-            When no translation is available, _attr_name is set as fallback.
-            This is required because setting _attr_name blocks HA's translation.
-        """
-        super().__init__(coordinator)
-
-        e = normalize_entry(entry)
-        self._block = block
-        self._offset = e["offset"]
-        self._length = e["length"]
-        self._decode_type = e["decode"]
-        self._factor = e["factor"]
-        self._unit = e.get("unit")
-        self._device_class = e.get("device_class")
-        self._state_class = e.get("state_class")
-        self._icon = e.get("icon")
-        self._device_id = device_id
-
-        # Store the name for later use in unique_id and visibility checks
-        self._entity_name = e["name"]
-
-        # Handle translation: don't set _attr_name when translation_key exists
-        # Setting _attr_name blocks HA's translation lookup
-        translation_key = e.get("translation_key")
-        if translation_key is not None:
-            self._attr_translation_key = translation_key
-            self._attr_has_entity_name = True
-        else:
-            # No translation available: use name as fallback
-            self._attr_name = e["name"]
-
-        # Set default visibility based on entity naming conventions
-        self._attr_entity_registry_enabled_default = (
-            not should_hide_entity_by_default(self._entity_name)
-        )
-
-
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Return if the entity should be enabled when first added to the registry."""
-        return self._attr_entity_registry_enabled_default
-
-    @property
-    def native_value(self) -> StateType | int | float | bool | str | None:
-        """Return the native value of the sensor.
-
-        Returns:
-        -------
-        StateType | int | float | bool | str | None
-            The native value of the sensor.
-        """
-        if self.coordinator.data is None:
-            return None
-
-        try:
-            payload = self.coordinator.data
-            # Validate payload length before slicing
-            if len(payload) < self._offset + self._length:
-                _LOGGER.warning(
-                    "Payload too short for sensor %s: "
-                    "expected at least %d bytes, got %d",
-                    self._entity_name,
-                    self._offset + self._length,
-                    len(payload),
-                )
-                return None
-            raw_bytes = payload[self._offset : self._offset + self._length]
-            return decode_value(raw_bytes, self._decode_type, self._factor)
-        except (ValueError, IndexError, TypeError) as err:
-            _LOGGER.error(
-                "Error decoding sensor %s: %s", self._entity_name, err, exc_info=True
-            )
-            return None
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the native unit of measurement for this sensor.
-
-        This property provides the unit in which the sensor's value is
-        measured natively, such as "°C" for temperature or "%" for humidity.
-
-        Returns:
-            The native unit of measurement, or None if not set.
-        """
-        return self._unit
-
-    @property
-    def device_class(self) -> SensorDeviceClass | None:
-        """Return the device class of the sensor.
-
-        Returns:
-            The device class, or None if not set.
-        """
-        return self._device_class
-
-    @property
-    def state_class(self) -> SensorStateClass | None:
-        """Return the state class of the sensor.
-
-        Returns:
-            The state class for long-term statistics, or None if not set.
-        """
-        return self._state_class
-
-    @property
-    def icon(self) -> str | None:
-        """Return the icon to use in the frontend.
-
-        Returns:
-            The icon string, or None if no icon is set.
-        """
-        return self._icon
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique identifier for the sensor entity.
-
-        Returns:
-            A string representing the unique ID of the sensor.
-        """
-        entity_key = self._entity_name.lower().replace(' ', '_')
-        return f"thz_{self._block}_{self._offset}_{entity_key}"
-
-    @property
-    def device_info(self):
-        """Return device information to link this entity with the device."""
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-        }
+# custom_components/thz/sensor.py
+"""THZ Sensor Platform for Home Assistant.
+
+This module provides the sensor platform for the THZ integration in Home Assistant.
+It defines the setup routine for sensor entities, decoding logic for raw sensor
+data, and a generic sensor entity class for representing THZ device sensors.
+
+Key Components:
+    - SENSOR_DESCRIPTIONS: Shared entity descriptions built from SENSOR_META.
+    - async_setup_entry: Asynchronous setup for THZ sensor entities.
+    - sensor_unique_id: Builds the unique_id of a sensor.
+    - parse_bit_type: Parses "bitX"/"nbitX" decode types into a mask.
+    - build_decoder: Builds a decoder callable for a decode type.
+    - decode_value: Utility function to decode raw bytes from the device.
+    - BlockDecoder: Decodes all sensors of one block in a single pass.
+    - normalize_entry: Helper to standardize sensor entry definitions.
+    - THZGenericSensor: Entity class representing a generic THZ sensor.
+
+The integration reads register mappings from the THZ device, decodes sensor
+values according to their metadata, and exposes them as HA sensor entities.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import struct
+
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, entity_slug, should_hide_entity_by_default
+from .register_maps.register_map_manager import RegisterMapManager
+from .sensor_meta import SENSOR_META
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pre-bound parsers avoid re-parsing the format string on every poll and
+# unpack directly from memoryview slices.
+_UNPACK_F32 = struct.Struct(">f").unpack_from
+_UNPACK_S16 = struct.Struct(">h").unpack_from
+_UNPACK_S32 = struct.Struct(">i").unpack_from
+_UNPACK_U16 = struct.Struct(">H").unpack_from
+_UNPACK_U32 = struct.Struct(">I").unpack_from
+
+
+def _build_description(name: str, meta: dict) -> SensorEntityDescription:
+    """Build the entity description for a sensor from its metadata.
+
+    Args:
+        name: The sensor name, used as description key.
+        meta: Metadata dict with optional unit, device_class, state_class,
+            icon and translation_key entries.
+
+    Returns:
+        The SensorEntityDescription for the sensor.
+    """
+    translation_key = meta.get("translation_key")
+    return SensorEntityDescription(
+        key=name,
+        native_unit_of_measurement=meta.get("unit"),
+        device_class=meta.get("device_class"),
+        state_class=meta.get("state_class"),
+        icon=meta.get("icon"),
+        translation_key=translation_key,
+        has_entity_name=translation_key is not None,
+        entity_registry_enabled_default=not should_hide_entity_by_default(name),
+    )
+
+
+# Descriptions are immutable, so build them once and share them between all
+# entities with the same sensor name.
+SENSOR_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
+    name: _build_description(name, meta) for name, meta in SENSOR_META.items()
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up THZ sensor entities from a config entry.
+
+    This function initializes sensor entities for the THZ integration by
+    retrieving register mappings, creating sensor metadata, and adding
+    the entities to Home Assistant.
+
+    Args:
+        hass: The Home Assistant instance.
+        config_entry: The configuration entry for this integration.
+        async_add_entities: Callback to add entities to Home Assistant.
+
+    Returns:
+        None
+    """
+    # Get data from hass.data
+    register_manager: RegisterMapManager = hass.data[DOMAIN]["register_manager"]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinators = entry_data["coordinators"]
+    device_id = hass.data[DOMAIN]["device_id"]
+
+    # Flatten the registers of all polled blocks into one pass and keep only
+    # the first occurrence of each sensor name. Dicts preserve insertion
+    # order, so this gives an ordered dedup without a separate set.
+    first_seen: dict[str, tuple] = {}
+    duplicates: list[str] = []
+    for block, fields in register_manager.get_sensor_fields().items():
+        # Get the coordinator for this block
+        coordinator = coordinators.get(block)
+        if coordinator is None:
+            _LOGGER.warning(
+                "No coordinator found for block %s, skipping sensors", block
+            )
+            continue
+
+        block_bytes = bytes.fromhex(block.removeprefix("pxx"))
+        for field in fields:
+            if field.name in first_seen:
+                duplicates.append(field.name)
+                continue
+            first_seen[field.name] = (coordinator, block_bytes, field)
+
+    if duplicates:
+        _LOGGER.debug(
+            "Skipped %d duplicate sensor names: %s",
+            len(duplicates),
+            ", ".join(duplicates),
+        )
+
+    # Sensors disabled in the registry (hidden by default or by the user) are
+    # not created, so they are never decoded. They stay in the registry, and
+    # enabling one reloads the config entry, which then creates it.
+    entity_reg = er.async_get(hass)
+    disabled_unique_ids = {
+        entity.unique_id
+        for entity in er.async_entries_for_config_entry(
+            entity_reg, config_entry.entry_id
+        )
+        if entity.disabled_by is not None
+    }
+
+    # Create sensors; sensors of the same block share one BlockDecoder
+    sensors = []
+    block_decoders: dict[bytes, BlockDecoder] = {}
+    for coordinator, block_bytes, field in first_seen.values():
+        if (
+            sensor_unique_id(block_bytes, field.offset, field.name)
+            in disabled_unique_ids
+        ):
+            continue
+        block_decoder = block_decoders.get(block_bytes)
+        if block_decoder is None:
+            block_decoder = block_decoders[block_bytes] = BlockDecoder()
+        # Offset and length are already in bytes
+        entry = {
+            "name": field.name,
+            "offset": field.offset,
+            "length": field.length,
+            "decode": field.decode,
+            "factor": field.factor,
+        }
+        sensors.append(
+            THZGenericSensor(
+                coordinator,
+                entry=entry,
+                block=block_bytes,
+                device_id=device_id,
+                block_decoder=block_decoder,
+            )
+        )
+    async_add_entities(sensors, True)
+
+
+def parse_bit_type(decode_type: str) -> tuple[int, bool] | None:
+    """Parse a "bitX"/"nbitX" decode type into its bit mask and negation.
+
+    Args:
+        decode_type: The decode type to parse.
+
+    Returns:
+        A (mask, negate) tuple, or None if decode_type is not a bit type.
+
+    Raises:
+        ValueError: If the bit number is invalid.
+    """
+    # Test the longer "nbit" prefix first so the order of the checks never
+    # decides whether "nbitX" is parsed as a bit number
+    if decode_type[:4] == "nbit":
+        return 1 << int(decode_type[4:]), True
+    if decode_type[:3] == "bit":
+        return 1 << int(decode_type[3:]), False
+    return None
+
+
+def build_decoder(
+    decode_type: str, factor: float = 1.0, length: int | None = None
+) -> Callable[[bytes], int | float | bool | str]:
+    """Build a decoder callable for the specified decode type.
+
+    The decode type is parsed once so that decoding a value on every
+    coordinator refresh is a single call without string comparisons.
+
+    Args:
+        decode_type: The type of decoding to apply. Supported types:
+            - "hex2int": Signed integer divided by factor.
+            - "hex": Unsigned integer.
+            - "bitX": Extracts bit number X (e.g., "bit3").
+            - "nbitX": Negation of bit X (e.g., "nbit2").
+            - "esp_mant": Mantissa and exponent representation.
+            - Any other: Returns hexadecimal representation.
+        factor: The divisor for "hex2int" decoding. Defaults to 1.0.
+        length: The length of the raw value in bytes, if known. Integer
+            values of 2 or 4 bytes are then decoded with a pre-bound
+            struct parser instead of int.from_bytes.
+
+    Returns:
+        A callable taking the raw bytes and returning the decoded value.
+
+    Raises:
+        ValueError: If the bit number of a "bitX"/"nbitX" type is invalid.
+    """
+    if decode_type == "hex2int":
+        # Only use 2 bytes; register indicates 4 chars in hex string
+        if length == 2:
+            return lambda raw: _UNPACK_S16(raw)[0] / factor
+        if length == 4:
+            return lambda raw: _UNPACK_S32(raw)[0] / factor
+        return lambda raw: int.from_bytes(raw, byteorder="big", signed=True) / factor
+    if decode_type == "hex":
+        # Only use 2 bytes; register indicates 4 chars in hex string
+        if length == 2:
+            return lambda raw: _UNPACK_U16(raw)[0]
+        if length == 4:
+            return lambda raw: _UNPACK_U32(raw)[0]
+        return lambda raw: int.from_bytes(raw, byteorder="big")
+    bit = parse_bit_type(decode_type)
+    if bit is not None:
+        # The bit mask is computed once, so decoding is a single AND per call
+        mask, negate = bit
+        if negate:
+            return lambda raw: (raw[0] & mask) == 0
+        return lambda raw: (raw[0] & mask) != 0
+    if decode_type == "esp_mant":
+        # FHEM code reverses bytes and unpacks, equivalent to big-endian
+        return lambda raw: round(_UNPACK_F32(raw)[0], 3)
+
+    return lambda raw: raw.hex()
+
+
+def decode_value(
+    raw: bytes, decode_type: str, factor: float = 1.0
+) -> int | float | bool | str:
+    """Decode a raw byte value according to the specified decode type.
+
+    Args:
+        raw: The raw bytes to decode.
+        decode_type: The type of decoding to apply (see build_decoder).
+        factor: The divisor for "hex2int" decoding. Defaults to 1.0.
+
+    Returns:
+        The decoded value (int, float, bool, or str).
+    """
+    return build_decoder(decode_type, factor)(raw)
+
+
+def normalize_entry(entry):
+    """Normalize a sensor entry to a standard dictionary format.
+
+    This function accepts either a tuple or a dictionary representing a
+    sensor entry. If a tuple is provided, it is unpacked into a dictionary
+    with predefined keys. If a dictionary is provided, it is returned as-is.
+
+    Args:
+        entry: The sensor entry to normalize. If a tuple, it should contain
+            (name, offset, length, decode, factor).
+
+    Returns:
+        A dictionary containing the normalized sensor entry.
+
+    Raises:
+        ValueError: If the entry is not a tuple or dictionary.
+    """
+    if isinstance(entry, tuple):
+        name, offset, length, decode, factor = entry
+        return {
+            "name": name.strip(),
+            "offset": offset,
+            "length": length,
+            "decode": decode,
+            "factor": factor,
+            "unit": None,
+            "device_class": None,
+            "state_class": None,
+            "icon": None,
+            "translation_key": None,
+        }
+    if isinstance(entry, dict):
+        return entry
+
+    raise ValueError("Unsupported sensor entry format.")
+
+
+def sensor_unique_id(block: bytes, offset: int, name: str) -> str:
+    """Return the unique_id of a sensor.
+
+    Args:
+        block: The block the sensor reads from.
+        offset: Offset of the sensor value in the block in bytes.
+        name: The sensor name.
+
+    Returns:
+        The unique_id, e.g. "thz_fb_4_outsidetemp".
+    """
+    return f"thz_{block.hex()}_{offset}_{entity_slug(name)}"
+
+
+# Marker stored by BlockDecoder for fields that lie beyond the payload
+PAYLOAD_TOO_SHORT = object()
+
+
+class BlockDecoder:
+    """Decodes the values of all sensors of one block in a single pass.
+
+    Sensors register their field once at setup and receive an index. The
+    first sensor that reads a new payload decodes every field of the block
+    from one shared memoryview; all other sensors of the block then read
+    their value from the cached list. A field that could not be decoded
+    holds PAYLOAD_TOO_SHORT or the raised exception instead of a value.
+
+    Bit fields are grouped by byte offset, so a status byte carrying
+    several bit sensors is read once and fanned out with their masks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty block decoder."""
+        self._fields: list[tuple[int, int, int, Callable]] = []
+        self._bit_groups: dict[int, list[tuple[int, int, bool]]] = {}
+        self._count = 0
+        # Payload length that covers every field, checked once per payload
+        self._required_size = 0
+        self._payload: bytes | None = None
+        self._values: list = []
+
+    def add(self, offset: int, length: int, decoder: Callable) -> int:
+        """Register a field and return its index in the decoded values.
+
+        Args:
+            offset: Offset of the field in the payload in bytes.
+            length: Length of the field in bytes.
+            decoder: Callable decoding the raw field bytes.
+
+        Returns:
+            The index of the field in the list returned by decode().
+        """
+        index = self._next_index()
+        self._fields.append((index, offset, offset + length, decoder))
+        self._required_size = max(self._required_size, offset + length)
+        return index
+
+    def add_bit(self, offset: int, mask: int, negate: bool = False) -> int:
+        """Register a single-bit field and return its index.
+
+        Args:
+            offset: Offset of the byte holding the bit in bytes.
+            mask: Mask selecting the bit within the byte.
+            negate: Whether the decoded value is the inverted bit.
+
+        Returns:
+            The index of the field in the list returned by decode().
+        """
+        index = self._next_index()
+        self._bit_groups.setdefault(offset, []).append((index, mask, negate))
+        self._required_size = max(self._required_size, offset + 1)
+        return index
+
+    def _next_index(self) -> int:
+        """Reserve the next value index and drop the cached values."""
+        self._payload = None
+        self._count += 1
+        return self._count - 1
+
+    def decode(self, payload: bytes) -> list:
+        """Return the decoded values of all fields for the given payload.
+
+        The result is cached until a different payload object is passed.
+
+        Args:
+            payload: The raw block payload from the coordinator.
+
+        Returns:
+            The decoded values, indexed as returned by add().
+        """
+        if payload is self._payload:
+            return self._values
+
+        view = memoryview(payload)
+        size = len(payload)
+        values: list = [PAYLOAD_TOO_SHORT] * self._count
+        fields = self._fields
+        bit_groups = self._bit_groups.items()
+        if size < self._required_size:
+            # Short payload: only decode the fields it covers; the others
+            # keep PAYLOAD_TOO_SHORT
+            fields = [field for field in fields if field[2] <= size]
+            bit_groups = [group for group in bit_groups if group[0] < size]
+        for index, offset, end, decoder in fields:
+            try:
+                values[index] = decoder(view[offset:end])
+            except (ValueError, IndexError, TypeError) as err:
+                values[index] = err
+        for offset, group in bit_groups:
+            byte = payload[offset]
+            for index, mask, negate in group:
+                values[index] = ((byte & mask) != 0) is not negate
+        self._payload = payload
+        self._values = values
+        return values
+
+
+class THZGenericSensor(CoordinatorEntity, SensorEntity):
+    """Represents a generic sensor entity for the THZ integration.
+
+    This class is responsible for managing the state and properties of a
+    sensor associated with a THZ device. It uses a coordinator to poll data
+    from the device at configurable intervals, then decodes the relevant
+    bytes for this sensor.
+
+    Attributes:
+        _block: Block identifier associated with the sensor.
+        _offset: Offset within the block for sensor data.
+        _length: Length of the sensor data in bytes.
+        _block_decoder: BlockDecoder shared with the other sensors of the block.
+        _index: Index of this sensor's value in the block's decoded values.
+        _entity_name: Internal name used for logging and unique_id.
+
+    Note:
+        Translation is handled via the description's translation_key when
+        available. Setting _attr_name blocks translation, so we only set it
+        when no translation is available.
+
+        Unit, device class, state class, icon, translation key and default
+        visibility come from a shared SensorEntityDescription, so only the
+        unique_id, device info and fallback name are stored per entity.
+    """
+
+    def __init__(
+        self, coordinator, entry, block, device_id, block_decoder=None
+    ) -> None:
+        """Initialize a sensor instance with the provided configuration.
+
+        Args:
+            coordinator: The DataUpdateCoordinator for this sensor's block.
+            entry: The configuration entry dict for the sensor.
+            block: The block associated with the sensor.
+            device_id: The unique device identifier.
+            block_decoder: The BlockDecoder shared by all sensors of the
+                block. A private decoder is created when omitted.
+
+        Note:
+            Sensors listed in SENSOR_META use the shared description from
+            SENSOR_DESCRIPTIONS; other entries get a description built from
+            the entry itself. _attr_name is only set when no translation is
+            available, because setting it blocks HA's translation.
+        """
+        super().__init__(coordinator)
+
+        e = normalize_entry(entry)
+        self._block = block
+        self._offset = e["offset"]
+        self._length = e["length"]
+        # Decoding happens in the block decoder; the decode type, factor and
+        # decoder callable are not needed on the entity after registration
+        if block_decoder is None:
+            block_decoder = BlockDecoder()
+        self._block_decoder = block_decoder
+        bit = parse_bit_type(e["decode"])
+        if bit is not None and self._length > 0:
+            self._index = block_decoder.add_bit(self._offset, *bit)
+        else:
+            self._index = block_decoder.add(
+                self._offset,
+                self._length,
+                build_decoder(e["decode"], e["factor"], self._length),
+            )
+        # Only the first error gets a traceback; repeats would log it per poll
+        self._first_error = True
+
+        # Store the name for later use in unique_id and visibility checks
+        self._entity_name = e["name"]
+
+        self._attr_unique_id = sensor_unique_id(
+            block, self._offset, self._entity_name
+        )
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
+
+        description = SENSOR_DESCRIPTIONS.get(self._entity_name)
+        if description is None:
+            description = _build_description(self._entity_name, e)
+        self.entity_description = description
+
+        # Setting _attr_name blocks HA's translation lookup
+        if description.translation_key is None:
+            # No translation available: use name as fallback
+            self._attr_name = e["name"]
+
+    @property
+    def available(self) -> bool:
+        """Return whether the last update could read this sensor's block."""
+        return super().available and self._payload() is not None
+
+    def _payload(self) -> bytes | None:
+        """Return this sensor's block payload from the shared coordinator."""
+        return (self.coordinator.data or {}).get(self._block)
+
+    @property
+    def native_value(self) -> StateType | int | float | bool | str | None:
+        """Return the native value of the sensor.
+
+        Returns:
+        -------
+        StateType | int | float | bool | str | None
+            The native value of the sensor.
+        """
+        payload = self._payload()
+        if payload is None:
+            return None
+
+        # The whole block is decoded once per payload and shared by its sensors
+        value = self._block_decoder.decode(payload)[self._index]
+        if value is PAYLOAD_TOO_SHORT:
+            _LOGGER.warning(
+                "Payload too short for sensor %s: "
+                "expected at least %d bytes, got %d",
+                self._entity_name,
+                self._offset + self._length,
+                len(payload),
+            )
+            return None
+        if isinstance(value, Exception):
+            _LOGGER.error(
+                "Error decoding sensor %s: %s",
+                self._entity_name,
+                value,
+                exc_info=value if self._first_error else None,
+            )
+            self._first_error = False
+            return None
+        return value
@@ -9,8 +9,9 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .base_entity import THZBaseEntity
+from .base_entity import THZCoordinatorEntity
 from .entity_translations import get_translation_key
 from .const import (
     WRITE_REGISTER_OFFSET,
@@ -22,22 +23,43 @@ from .value_codec import THZValueCodec
 
 _LOGGER = logging.getLogger(__name__)
 
+# Encoded on/off payloads are constant, so encode them once at import
+_ENCODED_ON = THZValueCodec.encode_switch(True)
+_ENCODED_OFF = THZValueCodec.encode_switch(False)
+
+# Window in which repeated turn on/off calls are coalesced into one write
+WRITE_DEBOUNCE = 0.05
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up switch entities for the THZ integration."""
+    """Set up switch entities for the THZ integration.
+
+    All switches share one coordinator that reads every switch register
+    back to back under a single device lock hold per update interval.
+    """
     await async_setup_write_platform(
-        hass, config_entry, async_add_entities, THZSwitch, "switch"
+        hass,
+        config_entry,
+        async_add_entities,
+        THZSwitch,
+        "switch",
+        offset=WRITE_REGISTER_OFFSET,
+        length=WRITE_REGISTER_LENGTH,
     )
 
 
+class THZSwitch(THZCoordinatorEntity, SwitchEntity):
+    """Representation of a THZ Switch entity.
 
-
-class THZSwitch(THZBaseEntity, SwitchEntity):
-    """Representation of a THZ Switch entity."""
+    The state is read by the shared switch coordinator created in
+    async_setup_write_platform; the entity does not poll on its own.
+    Switches whose register entry is marked "write_only" are not read back
+    at all: their state is the last value written and is reported as assumed.
+    """
 
     def __init__(
         self,
@@ -45,7 +67,7 @@ class THZSwitch(THZBaseEntity, SwitchEntity):
         entry: dict,
         device: THZDevice,
         device_id: str,
-        scan_interval: int | None = None,
+        coordinator: DataUpdateCoordinator,
     ) -> None:
         """Initialize a THZ switch entity.
 
@@ -54,43 +76,40 @@ class THZSwitch(THZBaseEntity, SwitchEntity):
             entry: The register entry dict containing configuration.
             device: The device instance this switch is associated with.
             device_id: The device identifier for linking to device.
-            scan_interval: The scan interval in seconds for polling updates.
+            coordinator: The coordinator reading all switch registers.
         """
         # Initialize base class with common properties
         super().__init__(
+            coordinator,
             name=name,
             command=entry["command"],
             device=device,
             device_id=device_id,
             icon=entry.get("icon"),
-            scan_interval=scan_interval,
             translation_key=get_translation_key(name),
         )
 
         # Switch-specific attributes
         self._is_on = False
+        self.write_only = bool(entry.get("write_only", False))
+        self._attr_assumed_state = self.write_only
+        # Last requested state and the task that will write it
+        self._pending_state: bool | None = None
+        self._write_task: asyncio.Task | None = None
+        # Only the first error gets a traceback; repeats would log it per poll
+        self._first_error = True
 
     @property
     def is_on(self) -> bool | None:
         """Return whether the switch is currently on."""
         return self._is_on
 
-    async def async_update(self) -> None:
-        """Update the switch state by reading the current value from the device."""
-        _LOGGER.debug(
-            "Updating switch %s with command %s", self.name, self._command
-        )
-
-        async with self._device.lock:
-            value_bytes = await self.hass.async_add_executor_job(
-                self._device.read_value,
-                bytes.fromhex(self._command),
-                "get",
-                WRITE_REGISTER_OFFSET,
-                WRITE_REGISTER_LENGTH,
-            )
-            # Short pause to ensure the device is ready
-            await asyncio.sleep(0.01)
+    def _update_from_coordinator(self) -> None:
+        """Decode this switch's value from the latest coordinator data."""
+        if self.write_only:
+            # Not read back; the state only changes through our own writes
+            return
+        value_bytes = self._register_bytes()
 
         # Validate that we received data
         if not value_bytes:
@@ -99,58 +118,81 @@ class THZSwitch(THZBaseEntity, SwitchEntity):
             )
             return
 
-        _LOGGER.debug("Received bytes for %s: %s", self.name, value_bytes.hex())
+        # Checked once per update so disabled debug logs cost no formatting
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "Received bytes for %s: %s", self.name, value_bytes.hex()
+            )
 
         try:
             # Use centralized codec for decoding
             self._is_on = THZValueCodec.decode_switch(value_bytes)
-            _LOGGER.debug("Decoded switch state for %s: %s", self.name, self._is_on)
+            if debug:
+                _LOGGER.debug(
+                    "Decoded switch state for %s: %s", self.name, self._is_on
+                )
         except (ValueError, IndexError, TypeError) as err:
             _LOGGER.error(
-                "Error decoding switch %s: %s", self.name, err, exc_info=True
+                "Error decoding switch %s: %s",
+                self.name, err, exc_info=self._first_error
             )
+            self._first_error = False
             # Keep previous value on error
 
-    async def turn_on(self, **kwargs: Any) -> None:
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a debounced write that has not been sent yet."""
+        if self._write_task is not None:
+            self._write_task.cancel()
+            self._write_task = None
+        await super().async_will_remove_from_hass()
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch by sending a command to the device."""
-        _LOGGER.debug("Turning on switch %s", self.name)
+        await self._async_write_bool(True)
 
-        try:
-            # Use centralized codec for encoding
-            value_bytes = THZValueCodec.encode_switch(True)
-
-            async with self._device.lock:
-                await self.hass.async_add_executor_job(
-                    self._device.write_value,
-                    bytes.fromhex(self._command),
-                    value_bytes,
-                )
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn off the switch by sending a command to the device."""
+        await self._async_write_bool(False)
 
-            self._is_on = True
-        except (ValueError, TypeError) as err:
-            _LOGGER.error(
-                "Error encoding switch %s to turn on: %s",
-                self.name, err, exc_info=True
+    async def _async_write_bool(self, state: bool) -> None:
+        """Request an on/off state and wait until it has been written.
+
+        Requests arriving within WRITE_DEBOUNCE of each other are coalesced
+        so only the last requested state is written to the device.
+
+        Args:
+            state: True to turn the switch on, False to turn it off.
+        """
+        self._pending_state = state
+        if self._write_task is None:
+            self._write_task = self.hass.async_create_task(
+                self._async_flush_pending()
             )
+        # Shielded so a cancelled caller does not drop other callers' write
+        await asyncio.shield(self._write_task)
 
-    async def turn_off(self, **kwargs: Any) -> None:
-        """Turn off the switch by sending a command to the device."""
-        _LOGGER.debug("Turning off switch %s", self.name)
+    async def _async_flush_pending(self) -> None:
+        """Write the last requested state once the debounce window closes."""
+        await asyncio.sleep(WRITE_DEBOUNCE)
+        state = self._pending_state
+        # Requests made from here on start a new window
+        self._pending_state = None
+        self._write_task = None
 
-        try:
-            # Use centralized codec for encoding
-            value_bytes = THZValueCodec.encode_switch(False)
-
-            async with self._device.lock:
-                await self.hass.async_add_executor_job(
-                    self._device.write_value,
-                    bytes.fromhex(self._command),
-                    value_bytes,
-                )
+        action = "on" if state else "off"
+        _LOGGER.debug("Turning %s switch %s", action, self.name)
 
-            self._is_on = False
-        except (ValueError, TypeError) as err:
+        try:
+            await self._device.submit_write(
+                self._command_bytes, _ENCODED_ON if state else _ENCODED_OFF
+            )
+            self._is_on = state
+            self.async_write_ha_state()
+        except (OSError, RuntimeError) as err:
+            # Connection, timeout and protocol errors raised by the write
             _LOGGER.error(
-                "Error encoding switch %s to turn off: %s",
-                self.name, err, exc_info=True
+                "Error writing switch %s to turn %s: %s",
+                self.name, action, err, exc_info=self._first_error
             )
+            self._first_error = False
@@ -5,9 +5,16 @@ communication with Stiebel Eltron LWZ / Tecalor THZ heat pumps.
 """
 
 import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 import logging
+import random
+import select
 import socket
 import time
+from typing import Any
 
 import serial
 
@@ -21,6 +28,15 @@ from .register_maps.register_map_manager import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Protocol bytes and sequences as module globals, built once instead of on
+# every exchange
+_DLE = const.DATALINKESCAPE
+_STX = const.STARTOFTEXT
+_DLE_STX = const.DATALINKESCAPE + const.STARTOFTEXT
+_DLE_ETX = const.DATALINKESCAPE + const.ENDOFTEXT
+_DLE_DLE = const.DATALINKESCAPE + const.DATALINKESCAPE
+_ESCAPED_2B = b"\x2b\x18"
+
 
 class THZDevice:
     """Represents the connection to the THZ heat pump."""
@@ -33,15 +49,25 @@ class THZDevice:
         tcp_port: int | None = None,
         baudrate: int = const.DEFAULT_BAUDRATE,
         read_timeout: float = const.TIMEOUT,
+        socket_options: Iterable[tuple[int, int, int]] = (),
     ) -> None:
-        """Initialize basic configuration – no communication yet."""
+        """Initialize basic configuration – no communication yet.
+
+        socket_options are extra (level, option, value) setsockopt calls
+        applied to the TCP socket after the built-in ones, e.g. to tune
+        SO_RCVBUF or keepalive for a particular ser2net bridge.
+        """
         self.connection = connection
         self.port = port
         self.host = host
         self.tcp_port = tcp_port
         self.baudrate = baudrate
         self.read_timeout = read_timeout
+        self.socket_options = [tuple(option) for option in socket_options]
         self._initialized = False
+        # The connection type never changes, so the I/O helpers branch on
+        # this flag instead of probing self.ser with hasattr on every call
+        self._is_tcp = connection == "ip"
 
         # Placeholders
         self.ser: serial.Serial | socket.socket | None = None
@@ -50,11 +76,39 @@ class THZDevice:
         self.write_register_map_manager: RegisterMapManagerWrite | None = None
         self._cache = {}
         self._cache_duration = 60
+        # Per-block cache lifetimes overriding _cache_duration, in seconds
+        self._cache_ttls: dict[bytes, float] = {}
+        # "get" telegrams only depend on the address, so each is built once
+        self._get_telegrams: dict[bytes, bytes] = {}
+        # Receive buffer reused by every data telegram read
+        self._rxbuf = bytearray(4096)
 
         # Thread lock for parallel access
         self.lock = asyncio.Lock()
-        self._last_access = 0
+        self._last_access = 0  # wall-clock end of the last exchange
         self._min_interval = 0.1  # minimum time between reads in seconds
+        # Pause the device needs after a request before the next one; tracked
+        # as a deadline so nobody sleeps while holding the lock needlessly
+        self._settle_time = 0.01
+        self._next_ready = 0.0
+
+        # Capped exponential backoff between failed reconnects; reset only by
+        # a completed exchange, not by a bare TCP connect
+        self._backoff_base = 0.5
+        self._backoff_cap = 60.0
+        self._reconnect_failures = 0
+        self._reconnect_not_before = 0.0
+
+        # All blocking I/O runs on one dedicated thread instead of HA's shared
+        # executor pool; the thread is started on first use
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="thz_io"
+        )
+
+        # Pending writes, sent in batches by a single worker task
+        self._write_queue: asyncio.Queue | None = None
+        self._write_worker: asyncio.Task | None = None
+        self._closed = False
 
         # ---------------------------------------------------------------------
 
@@ -71,9 +125,7 @@ class THZDevice:
             raise ValueError(f"Unknown connection type: {self.connection}")
 
         # Read firmware (runs synchronously in executor)
-        self._firmware_version = await hass.async_add_executor_job(
-            self.read_firmware_version
-        )
+        self._firmware_version = await self.async_run(self.read_firmware_version)
         _LOGGER.info("Firmware version detected: %s", self._firmware_version)
 
         # Load firmware-specific register maps
@@ -84,9 +136,21 @@ class THZDevice:
             self._firmware_version
         )
 
-        self._cache = {}  # { block_name: (timestamp, payload) }
+        self._cache = {}  # { block_name: (monotonic timestamp, payload) }
         self._cache_duration = 60  # seconds
 
+        # Every address polled later is known now, so build their telegrams
+        read_blocks = self.register_map_manager.get_all_registers()
+        write_registers = self.write_register_map_manager.get_all_registers()
+        self.prebuild_get_telegrams(
+            [bytes.fromhex(block.removeprefix("pxx")) for block in read_blocks]
+            + [
+                bytes.fromhex(entry["command"])
+                for entry in write_registers.values()
+                if entry.get("command")
+            ]
+        )
+
         self._initialized = True
 
     def _connect_serial(self):
@@ -114,6 +178,10 @@ class THZDevice:
         # This is essential for ser2net connections that may timeout after inactivity
         self.ser.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
+        # Disable Nagle's algorithm: the handshake sends single bytes and
+        # waits for the answer, so delaying small segments only adds latency
+        self.ser.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
         # Configure keepalive parameters (Linux-specific but safe on other platforms)
         # These settings ensure the connection stays alive even during long idle periods
         try:
@@ -131,6 +199,9 @@ class THZDevice:
             # Keepalive parameters may not be available on all platforms
             _LOGGER.warning("Could not set TCP keepalive parameters: %s", e)
 
+        for level, option, value in self.socket_options:
+            self.ser.setsockopt(level, option, value)
+
         self.ser.connect((self.host, self.tcp_port))
         _LOGGER.info("TCP connection established with keepalive enabled")
 
@@ -139,52 +210,52 @@ class THZDevice:
 
         Uses multiple methods to verify connection health:
         1. Check if socket/serial file descriptor is valid
-        2. For TCP: Try MSG_PEEK to detect closed connections
+        2. For TCP: Peek at pending data to detect closed connections
         3. For serial: Check is_open status
 
+        This is a diagnostic helper; send_request does not call it and
+        instead reconnects when a read or write fails.
+
         Returns:
             bool: True if connection is alive, False otherwise
         """
         if self.ser is None:
             return False
 
-        # Check if it's a socket - use hasattr to avoid issues with mocks
-        if hasattr(self.ser, 'fileno') and hasattr(self.ser, 'recv'):
-            # This is likely a socket
+        if self._is_tcp:
             try:
                 # Check if socket is still valid
                 if self.ser.fileno() == -1:
                     return False
 
-                # Try a quick peek without blocking to detect closed connections
-                # This is a best-effort check; MSG_PEEK may not work on all platforms
-                self.ser.setblocking(False)
-                try:
-                    # recv with MSG_PEEK doesn't remove data from buffer
-                    # Empty return on non-blocking socket just means no data available
-                    self.ser.recv(1, socket.MSG_PEEK)
-                except BlockingIOError:
-                    # No data available but connection is alive
-                    pass
-                except (OSError, socket.error):
-                    # Connection is broken
+                # Poll with a zero timeout instead of switching the socket to
+                # non-blocking mode; only peek when something is pending.
+                # Readable with nothing to peek means the peer closed.
+                readable, _, _ = select.select([self.ser], [], [], 0)
+                if readable and not self.ser.recv(1, socket.MSG_PEEK):
                     return False
 
                 return True
-            except (OSError, socket.error, AttributeError):
-                return False
-        elif hasattr(self.ser, 'is_open'):
-            # This is likely a serial connection
-            try:
-                return self.ser.is_open
-            except AttributeError:
+            except (OSError, ValueError, TypeError, AttributeError):
                 return False
-
-        # Unknown connection type or uninitialized
-        return False
+        try:
+            return self.ser.is_open
+        except AttributeError:
+            return False
 
     def _reconnect(self):
-        """Attempt to reconnect if connection was lost."""
+        """Attempt to reconnect if connection was lost.
+
+        After a failed attempt, further attempts are refused until a backoff
+        delay has passed, doubling per consecutive failure (with +/-25%
+        jitter) up to _backoff_cap, so an unreachable device is not hammered.
+
+        Raises:
+            ConnectionError: If called while backing off.
+        """
+        wait = self._reconnect_not_before - time.monotonic()
+        if wait > 0:
+            raise ConnectionError(f"Reconnect backing off for {wait:.1f}s")
         _LOGGER.warning("Attempting to reconnect...")
         try:
             if self.ser is not None:
@@ -200,26 +271,52 @@ class THZDevice:
 
             _LOGGER.info("Reconnection successful")
         except Exception as e:
-            _LOGGER.error("Reconnection failed: %s", e)
+            delay = min(
+                self._backoff_base * 2 ** min(self._reconnect_failures, 16),
+                self._backoff_cap,
+            ) * (0.75 + 0.5 * random.random())
+            self._reconnect_failures += 1
+            self._reconnect_not_before = time.monotonic() + delay
+            _LOGGER.error(
+                "Reconnection failed: %s; next attempt in %.1f s", e, delay
+            )
             raise
 
-    def read_block_cached(self, block: bytes, cache_duration: float = 60) -> bytes:
+    def set_cache_ttl(self, block: bytes, ttl: float) -> None:
+        """Set how long a block stays cached in read_block_cached.
+
+        Slowly changing blocks can use a long lifetime (float("inf") never
+        expires); writes still invalidate them.
+
+        Args:
+            block (bytes): The block identifier.
+            ttl (float): The duration in seconds to cache the block.
+        """
+        self._cache_ttls[block] = ttl
+
+    def read_block_cached(
+        self, block: bytes, cache_duration: float | None = None
+    ) -> bytes:
         """Read a block of data with caching support.
 
         Args:
             block (bytes): The block identifier to read.
-            cache_duration (float): The duration in seconds to cache the data.
-            Defaults to 60 seconds.
+            cache_duration (float | None): The duration in seconds to cache the
+            data. Defaults to the block's lifetime set with set_cache_ttl, or
+            60 seconds.
 
         Returns:
             bytes: The block data. Returns cached data if available and not expired,
             otherwise fetches fresh data.
         """
-        now = time.time()
-        if block in self._cache:
-            ts, data = self._cache[block]
-            if now - ts < cache_duration:
-                return data
+        if cache_duration is None:
+            cache_duration = self._cache_ttls.get(block, self._cache_duration)
+        # Monotonic, so wall clock steps (NTP, DST) cannot keep stale
+        # entries alive or expire fresh ones
+        now = time.monotonic()
+        entry = self._cache.get(block)
+        if entry is not None and now - entry[0] < cache_duration:
+            return entry[1]
 
         data = self.read_block(block, "get")
         self._cache[block] = (now, data)
@@ -228,7 +325,8 @@ class THZDevice:
     def send_request(self, telegram: bytes, get_or_set: str) -> bytes:
         """Send request via USB or TCP, receive response.
 
-        Automatically reconnects if connection is lost.
+        Automatically reconnects if a read or write reports a lost
+        connection; the connection is not probed before each request.
 
         Raises:
             ConnectionError: If connection fails and reconnection is unsuccessful.
@@ -236,26 +334,18 @@ class THZDevice:
                 invalid response).
         """
         timeout = self.read_timeout
-        data = bytearray()
         max_retries = 1  # Allow one retry on connection error
         last_error = None
 
         for attempt in range(max_retries + 1):
+            data = bytearray()
             try:
-                # Check connection health before sending (only if initialized)
-                if self._initialized and not self._is_connection_alive():
-                    _LOGGER.warning(
-                        "Connection not alive, attempting reconnect (attempt %d/%d)",
-                        attempt + 1, max_retries + 1
-                    )
-                    self._reconnect()
-
                 # 1. Send greeting (0x02)
-                self._write_bytes(const.STARTOFTEXT)
+                self._write_bytes(_STX)
 
                 # 2. Expect 0x10 response
                 response = self._read_exact(1, timeout)
-                if response != const.DATALINKESCAPE:
+                if response != _DLE:
                     resp_hex = response.hex() if response else 'no data'
                     error_msg = f"Handshake 1 failed, received: {resp_hex}"
                     _LOGGER.error(error_msg)
@@ -266,31 +356,28 @@ class THZDevice:
                 self._write_bytes(telegram)
 
                 # 4. Expect 0x10 0x02 response
-                # Note: Device may send 0x10 and 0x02 separately with a delay
+                # Note: Device may send 0x10 and 0x02 separately with a delay;
+                # _read_exact waits for both, so no fixed pause is needed
+                # between them (the Perl module sleeps 5 ms for firmware 2.x)
                 response = self._read_exact(2, timeout)
 
-                # Handle case where device sends 0x10 first, then 0x02 after delay
-                if response == const.DATALINKESCAPE:
+                # Handle case where only 0x10 arrived within the timeout
+                if response == _DLE:
                     _LOGGER.debug("Received 0x10, waiting for 0x02...")
-                    # Add delay for firmware 2.x as per Perl module
-                    # time.sleep() is used because this runs in executor (blocking)
-                    fw_ver = self._firmware_version
-                    if fw_ver and fw_ver.startswith("2"):
-                        time.sleep(0.005)
                     second_byte = self._read_exact(1, timeout)
-                    if second_byte == const.STARTOFTEXT:
-                        response = const.DATALINKESCAPE + const.STARTOFTEXT
+                    if second_byte == _STX:
+                        response = _DLE_STX
                     else:
                         byte_hex = second_byte.hex() if second_byte else 'no data'
                         error_msg = f"Handshake 2 failed: received 0x10 then {byte_hex}"
                         _LOGGER.error(error_msg)
                         raise RuntimeError(error_msg)
-                elif response == const.STARTOFTEXT:
+                elif response == _STX:
                     # Sometimes device sends just 0x02 (as per Perl code line 1525)
                     _LOGGER.debug("Received only 0x02 as response")
-                    response = const.DATALINKESCAPE + const.STARTOFTEXT  # Accept it
+                    response = _DLE_STX  # Accept it
 
-                if response != const.DATALINKESCAPE + const.STARTOFTEXT:
+                if response != _DLE_STX:
                     resp_hex = response.hex() if response else 'no data'
                     error_msg = f"Handshake 2 failed, received: {resp_hex}"
                     _LOGGER.error(error_msg)
@@ -298,33 +385,15 @@ class THZDevice:
 
                 if get_or_set == "get":
                     # 5. Send confirmation (0x10)
-                    self._write_bytes(const.DATALINKESCAPE)
+                    self._write_bytes(_DLE)
 
                     # 6. Receive data telegram until 0x10 0x03
-                    start_time = time.time()
-                    while time.time() - start_time < timeout:
-                        chunk = self._read_available()
-                        if chunk:
-                            data.extend(chunk)
-                            if (
-                                len(data) >= 8
-                                and data[-2:] == const.DATALINKESCAPE + const.ENDOFTEXT
-                            ):
-                                break
-
-                    if not (
-                        len(data) >= 8
-                        and data[-2:] == const.DATALINKESCAPE + const.ENDOFTEXT
-                    ):
-                        error_msg = (
-                            "No valid response received after data request - "
-                            "timeout or incomplete data"
-                        )
-                        _LOGGER.error(error_msg)
-                        raise RuntimeError(error_msg)
+                    data = self._read_frame(timeout)
 
                 # 7. End of communication
-                self._write_bytes(const.STARTOFTEXT)
+                self._write_bytes(_STX)
+                # A full exchange proves the link works; restart the backoff
+                self._reconnect_failures = 0
                 return bytes(data)
 
             except ConnectionError as e:
@@ -369,65 +438,131 @@ class THZDevice:
         Raises:
             ConnectionError: If the connection is closed or broken
         """
+        ser = self.ser
+        if ser is None:
+            raise ConnectionError("Not connected")
         try:
-            # Use hasattr to check connection type instead of isinstance
-            # This is more robust when modules are mocked in tests
-            if hasattr(self.ser, 'send') and hasattr(self.ser, 'recv'):
-                # This is a socket
-                self.ser.send(data)
-            elif hasattr(self.ser, 'write') and hasattr(self.ser, 'flush'):
-                # This is serial
-                self.ser.write(data)
-                self.ser.flush()
+            if self._is_tcp:
+                ser.sendall(data)
             else:
-                raise ConnectionError("Unknown connection type")
-        except (OSError, socket.error, BrokenPipeError) as e:
+                ser.write(data)
+                ser.flush()
+        except OSError as e:
             # Connection reset, broken pipe, or other socket/serial errors
             _LOGGER.error("Connection error during write: %s", e)
             raise ConnectionError(f"Failed to write to connection: {e}") from e
 
     def _read_exact(self, size: int, timeout: float) -> bytes:
-        """Read exactly n bytes, regardless of USB or TCP."""
-        end_time = time.time() + timeout
+        """Read exactly size bytes, regardless of USB or TCP.
+
+        Returns fewer bytes if the timeout expires first.
+        """
+        deadline = time.monotonic() + timeout
         buf = bytearray()
-        while len(buf) < size and time.time() < end_time:
-            chunk = self._read_available()
-            if chunk:
-                buf.extend(chunk)
-            # Note: time.sleep(0.01) was removed as it causes blocking in async context
+        while len(buf) < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            buf.extend(self._read_available(remaining, size - len(buf)))
         return bytes(buf)
 
-    def _read_available(self) -> bytes:
-        """Read available bytes.
+    def _read_frame(self, timeout: float) -> bytes:
+        """Read a data telegram up to and including its DLE ETX terminator.
+
+        Raises:
+            RuntimeError: If no complete telegram arrives within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        buf = self._rxbuf
+        view = memoryview(buf)
+        n = 0
+        while n < 8 or not buf.endswith(_DLE_ETX, 0, n):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or n == len(buf):
+                error_msg = (
+                    "No valid response received after data request - "
+                    "timeout or incomplete data"
+                )
+                _LOGGER.error(error_msg)
+                raise RuntimeError(error_msg)
+            n += self._read_into(view[n:], remaining)
+        return bytes(buf[:n])
+
+    def _read_into(self, view: memoryview, timeout: float) -> int:
+        """Wait for incoming bytes and read them straight into view.
+
+        Like _read_available, but without allocating a bytes object per
+        chunk.
+
+        Returns:
+            The number of bytes read; 0 if nothing arrived in time.
 
         Raises:
             ConnectionError: If the connection is closed or broken
         """
-        # Use hasattr to check connection type instead of isinstance
-        # This is more robust when modules are mocked in tests
-        if hasattr(self.ser, 'recv') and hasattr(self.ser, 'setblocking'):
-            # This is a socket
+        ser = self.ser
+        if ser is None:
+            raise ConnectionError("Not connected")
+        if self._is_tcp:
             try:
-                self.ser.setblocking(False)
-                data = self.ser.recv(1024)
-                if not data and hasattr(self.ser, 'fileno') and self.ser.fileno() == -1:
-                    # Socket is closed
-                    raise ConnectionError("TCP socket connection closed")
-                return data
+                readable, _, _ = select.select([ser], [], [], timeout)
+                if not readable:
+                    return 0
+                count = ser.recv_into(view)
+            except BlockingIOError:
+                return 0
+            except (OSError, ValueError) as e:
+                _LOGGER.error("TCP socket error during read: %s", e)
+                raise ConnectionError(f"TCP connection error: {e}") from e
+            if not count:
+                # Readable with no data means the peer closed the connection
+                raise ConnectionError("TCP socket connection closed")
+            return count
+        # Serial; readinto() blocks for up to the port timeout
+        size = min(max(1, ser.in_waiting), len(view))
+        return ser.readinto(view[:size]) or 0
+
+    def _read_available(self, timeout: float, size: int | None = None) -> bytes:
+        """Wait for incoming bytes and read them.
+
+        Blocks in the kernel until data arrives instead of polling, so the
+        device thread sleeps while the heat pump is answering.
+
+        Args:
+            timeout: Maximum time to wait for data, in seconds. Serial reads
+                use the port's own read timeout instead.
+            size: Maximum number of bytes to read; None reads whatever is
+                available.
+
+        Returns:
+            The bytes read; empty if nothing arrived in time.
+
+        Raises:
+            ConnectionError: If the connection is closed or broken
+        """
+        ser = self.ser
+        if ser is None:
+            raise ConnectionError("Not connected")
+        if self._is_tcp:
+            try:
+                readable, _, _ = select.select([ser], [], [], timeout)
+                if not readable:
+                    return b""
+                data = ser.recv(size or 4096)
             except BlockingIOError:
                 return b""
-            except (OSError, socket.error) as e:
-                # Connection reset, broken pipe, or other socket errors
+            except (OSError, ValueError) as e:
+                # Connection reset, closed socket, or other socket errors
                 _LOGGER.error("TCP socket error during read: %s", e)
                 raise ConnectionError(f"TCP connection error: {e}") from e
-        elif hasattr(self.ser, 'in_waiting') and hasattr(self.ser, 'read'):
-            # This is serial
-            waiting = getattr(self.ser, "in_waiting", 0)
-            if waiting > 0:
-                return self.ser.read(waiting)
-            return b""
-        else:
-            return b""
+            if not data:
+                # Readable with no data means the peer closed the connection
+                raise ConnectionError("TCP socket connection closed")
+            return data
+        # Serial; read() blocks for up to the port timeout
+        if size is None:
+            size = max(1, ser.in_waiting)
+        return ser.read(size)
 
     def _reset_input_buffer(self):
         """Delete any existing input buffer.
@@ -435,11 +570,134 @@ class THZDevice:
         TCP sockets do not have an input buffer to reset, so this is only
         relevant for serial connections.
         """
-        if self.ser is not None and hasattr(self.ser, "reset_input_buffer"):
+        if not self._is_tcp and self.ser is not None:
+            self.ser.reset_input_buffer()
+
+    async def async_run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking device call on the device's I/O thread.
+
+        Args:
+            func: The blocking callable, e.g. self.read_value.
+            *args: Positional arguments for func.
+
+        Returns:
+            The return value of func.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def async_close(self) -> None:
+        """Stop the write worker, close the connection and the I/O thread."""
+        self._closed = True
+        await self.async_stop_write_worker()
+        await self.async_run(self.close)
+        self._executor.shutdown(wait=False)
+
+    @asynccontextmanager
+    async def async_exclusive(self) -> AsyncIterator[None]:
+        """Hold the device lock for one exchange with the device.
+
+        Instead of sleeping after each request, the settle pause is only
+        awaited when the next exchange starts before it has passed. The
+        pause is awaited inside the lock, so waiting callers do not all wake
+        up at once. An uncontended asyncio.Lock is acquired without yielding
+        to the event loop, so no separate fast path is needed.
+        """
+        async with self.lock:
+            delay = self._next_ready - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                yield
+            finally:
+                self._next_ready = time.monotonic() + self._settle_time
+                self._last_access = time.time()
+
+    async def submit_write(self, addr_bytes: bytes, value: bytes) -> None:
+        r"""Queue a write and wait until it has been sent to the device.
+
+        Writes are sent by one long-lived worker task. Writes queued while
+        a batch is in flight are sent together in a single executor job
+        under a single acquisition of the device lock.
+
+        Args:
+            addr_bytes: Register address bytes (e.g. b'\xfb').
+            value: Bytes to write to the device.
+
+        Raises:
+            RuntimeError: If the device has been closed.
+            Exception: Whatever write_value raised for this write.
+        """
+        if self._closed:
+            raise RuntimeError("THZ device is closed, write refused")
+        loop = asyncio.get_running_loop()
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue()
+        if self._write_worker is None or self._write_worker.done():
+            self._write_worker = loop.create_task(self._async_write_worker())
+        future = loop.create_future()
+        self._write_queue.put_nowait((addr_bytes, value, future))
+        await future
+
+    async def async_stop_write_worker(self) -> None:
+        """Stop the write worker; queued writes fail with CancelledError."""
+        if self._write_worker is not None:
+            self._write_worker.cancel()
             try:
-                self.ser.reset_input_buffer()
-            except AttributeError:
+                await self._write_worker
+            except asyncio.CancelledError:
                 pass
+            self._write_worker = None
+        if self._write_queue is not None:
+            while not self._write_queue.empty():
+                _, _, future = self._write_queue.get_nowait()
+                future.cancel()
+
+    async def _async_write_worker(self) -> None:
+        """Send queued writes in batches until cancelled."""
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                async with self.async_exclusive():
+                    results = await self.async_run(
+                        self._write_batch,
+                        [(addr_bytes, value) for addr_bytes, value, _ in batch],
+                    )
+            except asyncio.CancelledError:
+                for _, _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as err:
+                # The batch never reached the device (e.g. the I/O thread is
+                # gone); fail its writes and keep serving the queue
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(err)
+                continue
+            for (_, _, future), error in zip(batch, results):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+    def _write_batch(
+        self, writes: list[tuple[bytes, bytes]]
+    ) -> list[Exception | None]:
+        """Write each (address, value) pair; return the error of each write."""
+        errors: list[Exception | None] = []
+        for addr_bytes, value in writes:
+            try:
+                self.write_value(addr_bytes, value)
+            except Exception as err:
+                errors.append(err)
+            else:
+                errors.append(None)
+        return errors
 
     def close(self):
         """Close the connection."""
@@ -448,18 +706,19 @@ class THZDevice:
 
     def thz_checksum(self, data: bytes) -> bytes:
         """Calculate THZ checksum for given data."""
-        checksum = sum(b for i, b in enumerate(data) if i != 2)
-        checksum = checksum % 256
-        return bytes([checksum])
+        # Sum of all bytes except the checksum slot at index 2, done by the
+        # builtin sum instead of a per-byte generator
+        checksum = sum(data)
+        if len(data) > 2:
+            checksum -= data[2]
+        return bytes([checksum & 0xFF])
 
     def unescape(self, data: bytes) -> bytes:
         """Remove escape sequences from data."""
         # 0x10 0x10 -> 0x10
-        data = data.replace(
-            const.DATALINKESCAPE + const.DATALINKESCAPE, const.DATALINKESCAPE
-        )
+        data = data.replace(_DLE_DLE, _DLE)
         # 0x2B 0x18 -> 0x2B
-        return data.replace(b"\x2b\x18", b"\x2b")
+        return data.replace(_ESCAPED_2B, b"\x2b")
 
     def escape(self, data: bytes) -> bytes:
         """Add escape sequences to data before sending.
@@ -478,9 +737,9 @@ class THZDevice:
             Escaped bytes ready to send
         """
         # 0x10 -> 0x10 0x10 (matches Perl line 1764)
-        data = data.replace(const.DATALINKESCAPE, const.DATALINKESCAPE + const.DATALINKESCAPE)
+        data = data.replace(_DLE, _DLE_DLE)
         # 0x2B -> 0x2B 0x18 (matches Perl line 1768)
-        return data.replace(b"\x2b", b"\x2b\x18")
+        return data.replace(b"\x2b", _ESCAPED_2B)
 
     def decode_response(self, data: bytes):
         """Decode the response from the THZ device, checking header, CRC, and unescaping."""
@@ -547,17 +806,14 @@ class THZDevice:
             ConnectionError: If connection fails
             RuntimeError: If device communication fails
         """
-        header = b"\x01\x00" if get_or_set == "get" else b"\x01\x80"
-        # Standard Header für "get" und "set"
-        footer = const.DATALINKESCAPE + const.ENDOFTEXT  # Standard Footer
-
-        checksum = self.thz_checksum(header + b"\x00" + addr_bytes + payload_to_deliver)
-        # b'\x00' = Platzhalter für die Checksumme
-        # _LOGGER.debug(f"Berechnete Checksumme: {checksum.hex()} für Adresse {addr_bytes.hex()}
-        # mit Payload {payload_to_deliver.hex()}")
-        telegram = self.construct_telegram(
-            addr_bytes + payload_to_deliver, header, footer, checksum
-        )
+        if get_or_set == "get" and not payload_to_deliver:
+            telegram = self._get_telegrams.get(addr_bytes)
+            if telegram is None:
+                telegram = self._get_telegrams[addr_bytes] = self._build_telegram(
+                    addr_bytes, "get", b""
+                )
+        else:
+            telegram = self._build_telegram(addr_bytes, get_or_set, payload_to_deliver)
         # _LOGGER.debug(f"Konstruiertes Telegramm: {telegram.hex()}")
         raw_response = self.send_request(telegram, get_or_set)
         # _LOGGER.debug(f"Rohantwort erhalten: {raw_response.hex()}")
@@ -570,6 +826,34 @@ class THZDevice:
 
         return b""
 
+    def prebuild_get_telegrams(self, addresses: list[bytes]) -> None:
+        """Build and keep the "get" telegram of each register address.
+
+        Args:
+            addresses: Register address bytes that will be read.
+        """
+        for addr_bytes in addresses:
+            if addr_bytes not in self._get_telegrams:
+                self._get_telegrams[addr_bytes] = self._build_telegram(
+                    addr_bytes, "get", b""
+                )
+
+    def _build_telegram(
+        self, addr_bytes: bytes, get_or_set: str, payload_to_deliver: bytes
+    ) -> bytes:
+        """Build the complete telegram for a register read or write."""
+        header = b"\x01\x00" if get_or_set == "get" else b"\x01\x80"
+        # Standard Header für "get" und "set"
+        footer = _DLE_ETX  # Standard Footer
+
+        checksum = self.thz_checksum(header + b"\x00" + addr_bytes + payload_to_deliver)
+        # b'\x00' = Platzhalter für die Checksumme
+        # _LOGGER.debug(f"Berechnete Checksumme: {checksum.hex()} für Adresse {addr_bytes.hex()}
+        # mit Payload {payload_to_deliver.hex()}")
+        return self.construct_telegram(
+            addr_bytes + payload_to_deliver, header, footer, checksum
+        )
+
     def construct_telegram(
         self, addr_bytes: bytes, header: bytes, footer: bytes, checksum: bytes
     ) -> bytes:
@@ -628,6 +912,51 @@ class THZDevice:
         response = self.read_write_register(addr_bytes, get_or_set)
         return response[offset : offset + length]
 
+    def read_values(
+        self, addr_list: list[bytes], get_or_set: str, offset: int, length: int
+    ) -> dict[bytes, bytes | None]:
+        """Read the same slice of several registers back to back.
+
+        Args:
+            addr_list: Register address bytes to read.
+            get_or_set: Operation type, "get" or "set".
+            offset: Byte offset in each response to read from.
+            length: Number of bytes to read from each response.
+
+        Returns:
+            The requested bytes per address; None for reads that failed, so
+            one failing register does not lose the others.
+        """
+        values: dict[bytes, bytes | None] = {}
+        for addr_bytes in addr_list:
+            try:
+                values[addr_bytes] = self.read_value(
+                    addr_bytes, get_or_set, offset, length
+                )
+            except Exception as err:
+                _LOGGER.warning("Reading %s failed: %s", addr_bytes.hex(), err)
+                values[addr_bytes] = None
+        return values
+
+    def read_blocks(self, blocks: list[bytes]) -> dict[bytes, bytes | None]:
+        """Read several blocks back to back.
+
+        Args:
+            blocks: Block address bytes to read.
+
+        Returns:
+            The payload per block; None for reads that failed, so one
+            failing block does not lose the others.
+        """
+        payloads: dict[bytes, bytes | None] = {}
+        for block in blocks:
+            try:
+                payloads[block] = self.read_block(block, "get")
+            except Exception as err:
+                _LOGGER.warning("Reading block %s failed: %s", block.hex(), err)
+                payloads[block] = None
+        return payloads
+
     def write_value(self, addr_bytes: bytes, value: bytes) -> None:
         r"""Write a value to the THZ device.
 
@@ -636,6 +965,8 @@ class THZDevice:
             value: Bytes to write to the device.
         """
         self.read_write_register(addr_bytes, "set", value)
+        # A write can change any block, so cached reads are no longer valid
+        self._cache.clear()
         _LOGGER.debug("Value %s written to address %s", value, addr_bytes.hex())
 
     def read_block(self, addr_bytes: bytes, get_or_set: str) -> bytes:
@@ -650,6 +981,13 @@ class THZDevice:
         """
         return self.read_write_register(addr_bytes, get_or_set)
 
+    @property
+    def last_access(self) -> datetime | None:
+        """Return when the last exchange with the device finished."""
+        if not self._last_access:
+            return None
+        return datetime.fromtimestamp(self._last_access, tz=timezone.utc)
+
     @property
     def firmware_version(self) -> str:
         """Return the firmware version of the device."""
@@ -1,7 +1,6 @@
 """Time entity for THZ devices."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import time
 
@@ -9,20 +8,29 @@ from homeassistant.components.time import TimeEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .base_entity import THZBaseEntity
+from .base_entity import THZCoordinatorEntity
 from .const import (
+    DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     TIME_VALUE_UNSET,
-    WRITE_REGISTER_OFFSET,
-    WRITE_REGISTER_LENGTH,
+    entity_slug,
 )
 from .entity_translations import get_translation_key
+from .platform_setup import create_write_coordinator
 from .register_maps.register_map_manager import RegisterMapManagerWrite
 from .thz_device import THZDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Slice of a schedule register response holding start, end and 2 unused bytes
+SCHEDULE_OFFSET = 4
+SCHEDULE_LENGTH = 4
+
+# time for every valid quarter count (0 => 00:00 ... 95 => 23:45)
+_QUARTER_TIMES = tuple(time(num // 4, num % 4 * 15) for num in range(96))
+
 
 def time_to_quarters(t: time | None) -> int:
     """Convert a time object to the number of 15-minute intervals since midnight.
@@ -76,6 +84,7 @@ def quarters_to_time(num: int) -> time | None:
     -----
     - The function validates the 0–95 range and logs a warning for out-of-range values.
     - Invalid values are clamped to the valid range (0-95) to prevent crashes.
+    - Valid values are looked up in a table built at import time.
 
     Examples:
     --------
@@ -92,7 +101,7 @@ def quarters_to_time(num: int) -> time | None:
         return None
 
     # Validate range and clamp if necessary
-    if num < 0 or num > 95:
+    if not 0 <= num <= 95:
         _LOGGER.warning(
             "Invalid quarters value %s (expected 0-95). Value will be clamped. "
             "This may indicate a byte order issue in reading the time value.",
@@ -100,48 +109,78 @@ def quarters_to_time(num: int) -> time | None:
         )
         num = max(0, min(95, num))
 
-    quarters = num % 4
-    hour = (num - quarters) // 4
-    _LOGGER.debug("Converting %s to time: %s:%s", num, hour, quarters * 15)
-    return time(hour, quarters * 15)
+    return _QUARTER_TIMES[num]
+
 
+def _parse_hhmm(value: str) -> tuple[int, int]:
+    """Split an "HH:MM" (or "HH:MM:SS") string into hour and minute.
 
+    The fixed positions are sliced directly instead of splitting the string.
+    A single-digit hour ("H:MM") is accepted as well and shifts every
+    position by one.
+
+    Raises:
+        ValueError: If the string has another format or is out of range.
+    """
+    colon = 1 if value[1:2] == ":" else 2
+    if (
+        len(value) not in (colon + 3, colon + 6)
+        or value[colon] != ":"
+        or (len(value) == colon + 6 and value[colon + 3] != ":")
+    ):
+        raise ValueError(f"Invalid time format: {value}")
+    hour, minute = int(value[:colon]), int(value[colon + 1 : colon + 3])
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"Invalid time values: hour={hour}, minute={minute}")
+    return hour, minute
 
 
-def _create_time_entities(name, entry, device, device_id, write_interval):
-    """Factory function to create time entities, handling schedule types specially."""
+
+
+def _create_time_entities(name, entry, device, device_id, coordinator):
+    """Factory function to create time entities, handling schedule types specially.
+
+    Always returns a list: the start and end entity for a schedule, otherwise
+    the single time entity. The coordinator must be the one reading registers
+    of the entry's type.
+    """
     if entry["type"] == "schedule":
         # Create both start and end time entities for schedule type
         # Pass the base name to both so they can look up the base translation key
+        start = THZScheduleTime(
+            name=f"{name} Start",
+            base_name=name,
+            entry=entry,
+            device=device,
+            device_id=device_id,
+            time_type="start",
+            coordinator=coordinator,
+        )
+        end = THZScheduleTime(
+            name=f"{name} End",
+            base_name=name,
+            entry=entry,
+            device=device,
+            device_id=device_id,
+            time_type="end",
+            coordinator=coordinator,
+        )
+        # Both halves live in the same register; linking them lets a write
+        # reuse the sibling's last read instead of reading the register again
+        start._sibling = end
+        end._sibling = start
+        return [start, end]
+    else:
+        # Regular time entity, as a list so callers can always extend
         return [
-            THZScheduleTime(
-                name=f"{name} Start",
-                base_name=name,
-                entry=entry,
-                device=device,
-                device_id=device_id,
-                time_type="start",
-                scan_interval=write_interval,
-            ),
-            THZScheduleTime(
-                name=f"{name} End",
-                base_name=name,
+            THZTime(
+                name=name,
                 entry=entry,
                 device=device,
                 device_id=device_id,
-                time_type="end",
-                scan_interval=write_interval,
-            ),
+                coordinator=coordinator,
+            )
         ]
-    else:
-        # Regular time entity
-        return THZTime(
-            name=name,
-            entry=entry,
-            device=device,
-            device_id=device_id,
-            scan_interval=write_interval,
-        )
 
 
 async def async_setup_entry(
@@ -149,18 +188,52 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up THZ Time entities from a config entry."""
+    """Set up THZ Time entities from a config entry.
+
+    Schedule entities share one coordinator that reads every schedule
+    register once per update interval, so the start and end entity of a
+    register no longer read it separately. Regular time entities share a
+    second coordinator with the same interval.
+    """
     # Use platform setup for both "time" and "schedule" types
     write_manager: RegisterMapManagerWrite = hass.data[DOMAIN]["write_manager"]
     device: THZDevice = hass.data[DOMAIN]["device"]
     device_id = hass.data[DOMAIN]["device_id"]
 
-    from .const import DEFAULT_UPDATE_INTERVAL
     write_interval = config_entry.data.get("write_interval", DEFAULT_UPDATE_INTERVAL)
 
     write_registers = write_manager.get_all_registers()
     _LOGGER.debug("Loading time platform with %d registers", len(write_registers))
 
+    schedule_coordinator = create_write_coordinator(
+        hass,
+        device,
+        "THZ schedules",
+        write_interval,
+        # Each register once, although its start and end entity both use it
+        list(
+            dict.fromkeys(
+                bytes.fromhex(entry["command"])
+                for entry in write_registers.values()
+                if entry["type"] == "schedule"
+            )
+        ),
+        SCHEDULE_OFFSET,
+        SCHEDULE_LENGTH,
+    )
+
+    time_coordinator = create_write_coordinator(
+        hass,
+        device,
+        "THZ time",
+        write_interval,
+        [
+            bytes.fromhex(entry["command"])
+            for entry in write_registers.values()
+            if entry["type"] == "time"
+        ],
+    )
+
     entities = []
     for name, entry in write_registers.items():
         if entry["type"] in ("time", "schedule"):
@@ -168,17 +241,37 @@ async def async_setup_entry(
                 "Creating time entities for %s (type: %s) with command %s",
                 name, entry["type"], entry["command"]
             )
-            new_entities = _create_time_entities(name, entry, device, device_id, write_interval)
-            entities.extend(new_entities if isinstance(new_entities, list) else [new_entities])
+            entities.extend(
+                _create_time_entities(
+                    name,
+                    entry,
+                    device,
+                    device_id,
+                    schedule_coordinator
+                    if entry["type"] == "schedule"
+                    else time_coordinator,
+                )
+            )
 
     _LOGGER.info("Created %d time entities", len(entities))
-    async_add_entities(entities, True)
+    schedules = [e for e in entities if isinstance(e, THZScheduleTime)]
+    if schedules:
+        await schedule_coordinator.async_refresh()
+        async_add_entities(schedules)
+    times = [e for e in entities if isinstance(e, THZTime)]
+    if times:
+        await time_coordinator.async_refresh()
+        async_add_entities(times)
 
 
 
 
-class THZTime(THZBaseEntity, TimeEntity):
-    """Time entity for THZ devices."""
+class THZTime(THZCoordinatorEntity, TimeEntity):
+    """Time entity for THZ devices.
+
+    The value is read by the shared time coordinator created in
+    async_setup_entry; the entity does not poll on its own.
+    """
 
     def __init__(
         self,
@@ -186,7 +279,7 @@ class THZTime(THZBaseEntity, TimeEntity):
         entry: dict,
         device: THZDevice,
         device_id: str,
-        scan_interval: int | None = None
+        coordinator: DataUpdateCoordinator,
     ) -> None:
         """Initialize a THZ time entity.
 
@@ -195,16 +288,16 @@ class THZTime(THZBaseEntity, TimeEntity):
             entry: The register entry dict containing configuration.
             device: THZ device instance.
             device_id: The device identifier for linking to device.
-            scan_interval: The scan interval in seconds for polling updates.
+            coordinator: The coordinator reading all time registers.
         """
         # Initialize base class with common properties
         super().__init__(
+            coordinator,
             name=name,
             command=entry["command"],
             device=device,
             device_id=device_id,
             icon=entry.get("icon", "mdi:clock"),
-            scan_interval=scan_interval,
             translation_key=get_translation_key(name),
         )
 
@@ -213,68 +306,64 @@ class THZTime(THZBaseEntity, TimeEntity):
 
         self._attr_native_value = None
 
-    @property
-    def name(self) -> str | None:
-        """Return the name of the time entity.
-
-        Always return the entity name since time entities don't use translation keys.
-        """
-        return self._attr_name
-
     @property
     def native_value(self):
         """Return the native value of the time."""
         return self._attr_native_value
 
-    async def async_update(self):
-        """Fetch new state data for the time."""
-        async with self._device.lock:
-            value_bytes = await self.hass.async_add_executor_job(
-                self._device.read_value,
-                bytes.fromhex(self._command),
-                "get",
-                WRITE_REGISTER_OFFSET,
-                WRITE_REGISTER_LENGTH,
+    def _update_from_coordinator(self) -> None:
+        """Decode this time from the latest coordinator data."""
+        value_bytes = self._register_bytes()
+        if not value_bytes:
+            _LOGGER.warning(
+                "No data received for time %s, keeping previous value", self.name
             )
-            # Short pause to ensure the device is ready
-            await asyncio.sleep(0.01)
+            return
 
         # Time values are stored as single bytes (0-95 quarters)
         num = value_bytes[0]
         self._attr_native_value = quarters_to_time(num)
-        _LOGGER.debug("Updated time %s: %s quarters -> %s", self._attr_name, num, self._attr_native_value)
+        # Checked per update so disabled debug logs cost no argument evaluation
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updated time %s: %s quarters -> %s",
+                self.name, num, self._attr_native_value
+            )
 
     async def async_set_native_value(self, value: str):
         """Set new value for the time."""
-        # Convert string (e.g., "12:30") to datetime.time
+        # Convert string (e.g., "12:30") straight to quarters; the stored
+        # time comes from the lookup table instead of a new time object
         if value is None:
-            t_value = None
+            num = TIME_VALUE_UNSET
         else:
-            hour, minute = map(int, value.split(":"))
-            t_value = time(hour, minute)
-
-        num = time_to_quarters(t_value)
-        _LOGGER.debug("Setting time %s to %s (%s quarters)", self._attr_name, t_value, num)
+            hour, minute = _parse_hhmm(value)
+            num = hour * 4 + minute // 15
+        t_value = quarters_to_time(num)
+        _LOGGER.debug("Setting time %s to %s (%s quarters)", self.name, t_value, num)
 
         # Write as 2 bytes to match the protocol's read format (offset=4, length=2)
         # even though only the first byte contains the meaningful time value (0-95 quarters).
         # Second byte is set to 0 as it appears to be unused by the device.
         num_bytes = bytes([num, 0])
 
-        async with self._device.lock:
-            await self.hass.async_add_executor_job(
-                self._device.write_value, bytes.fromhex(self._command), num_bytes
+        async with self._device.async_exclusive():
+            await self._device.async_run(
+                self._device.write_value, self._command_bytes, num_bytes
             )
-            # Short pause to ensure the device is ready
-            await asyncio.sleep(0.01)
 
         self._attr_native_value = t_value
+        self.async_write_ha_state()
+
 
 
 
+class THZScheduleTime(THZCoordinatorEntity, TimeEntity):
+    """Time entity for THZ schedule start/end times.
 
-class THZScheduleTime(THZBaseEntity, TimeEntity):
-    """Time entity for THZ schedule start/end times."""
+    The register is read by the shared schedule coordinator created in
+    async_setup_entry; the entity does not poll on its own.
+    """
 
     def __init__(
         self,
@@ -284,7 +373,7 @@ class THZScheduleTime(THZBaseEntity, TimeEntity):
         device: THZDevice,
         device_id: str,
         time_type: str,
-        scan_interval: int | None = None
+        coordinator: DataUpdateCoordinator,
     ) -> None:
         """Initialize a THZ schedule time entity.
 
@@ -296,8 +385,8 @@ class THZScheduleTime(THZBaseEntity, TimeEntity):
             device: THZ device instance.
             device_id: The device identifier for linking to device.
             time_type: Either "start" or "end".
-            scan_interval: The scan interval in seconds for polling updates.
-            
+            coordinator: The coordinator reading all schedule registers.
+
         Example:
             For base_name="programHC1_Mo_0" and time_type="start", the translation key
             becomes "programhc1_mo_0_start" which resolves to "HC1 Program Monday 1 Start".
@@ -311,12 +400,17 @@ class THZScheduleTime(THZBaseEntity, TimeEntity):
         
         # Initialize base class with common properties
         super().__init__(
+            coordinator,
             name=name,
             command=entry["command"],
             device=device,
             device_id=device_id,
             icon=entry.get("icon", "mdi:calendar-clock"),
-            scan_interval=scan_interval,
+            # unique_id includes time_type so start and end do not collide
+            unique_id=(
+                f"thz_schedule_time_{entry['command'].lower()}_"
+                f"{entity_slug(name)}_{time_type}"
+            ),
             translation_key=translation_key,
         )
 
@@ -325,23 +419,27 @@ class THZScheduleTime(THZBaseEntity, TimeEntity):
 
         self._time_type = time_type
         self._attr_native_value = None
-
-        # Override unique_id to include time_type
-        self._attr_unique_id = f"thz_schedule_time_{self._command.lower()}_{name.lower().replace(' ', '_')}_{time_type}"
+        # Entity for the other half of the same register and the last raw
+        # register bytes, shared with it (set by _create_time_entities)
+        self._sibling: THZScheduleTime | None = None
+        self._last_raw: bytes | None = None
 
     @property
     def native_value(self):
         """Return the native value of the time."""
         return self._attr_native_value
 
-    async def async_update(self):
-        """Fetch new state data for the schedule time."""
-        async with self._device.lock:
-            value_bytes = await self.hass.async_add_executor_job(
-                self._device.read_value, bytes.fromhex(self._command), "get", 4, 4
+    def _update_from_coordinator(self) -> None:
+        """Decode this entity's half of the register from the coordinator data."""
+        value_bytes = self._register_bytes()
+        if not value_bytes:
+            _LOGGER.warning(
+                "No data received for schedule time %s, keeping previous value",
+                self.name,
             )
-            # Short pause to ensure the device is ready
-            await asyncio.sleep(0.01)
+            return
+
+        self._store_raw(value_bytes)
 
         # Schedule data format (from FHEM 7prog):
         # - Bytes 0-3: header/other data
@@ -356,56 +454,70 @@ class THZScheduleTime(THZBaseEntity, TimeEntity):
             num = value_bytes[1]
 
         self._attr_native_value = quarters_to_time(num)
-        _LOGGER.debug(
-            "Updated schedule time %s (%s): %s quarters -> %s",
-            self.name, self._time_type, num, self._attr_native_value
-        )
+        # Checked per update so the name property is only resolved for logging
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updated schedule time %s (%s): %s quarters -> %s",
+                self.name, self._time_type, num, self._attr_native_value
+            )
 
     async def async_set_native_value(self, value: str):
         """Set new value for the schedule time."""
-        # Convert string (e.g., "12:30") to datetime.time
+        # Convert string (e.g., "12:30") straight to quarters; the stored
+        # time comes from the lookup table instead of a new time object
         if value is None:
-            t_value = None
+            new_num = TIME_VALUE_UNSET
         else:
             try:
-                parts = value.split(":")
-                if len(parts) != 2:
-                    raise ValueError(f"Invalid time format: {value}")
-                hour, minute = int(parts[0]), int(parts[1])
-                if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                    raise ValueError(f"Invalid time values: hour={hour}, minute={minute}")
-                t_value = time(hour, minute)
-            except (ValueError, AttributeError) as e:
+                hour, minute = _parse_hhmm(value)
+            except (ValueError, TypeError) as e:
                 _LOGGER.error("Failed to parse time value '%s': %s", value, e)
                 raise
-
-        new_num = time_to_quarters(t_value)
+            new_num = hour * 4 + minute // 15
+        t_value = quarters_to_time(new_num)
         _LOGGER.debug(
             "Setting schedule time %s (%s) to %s (%s quarters)",
             self.name, self._time_type, t_value, new_num
         )
 
-        # Read the current schedule data (4 bytes total)
-        async with self._device.lock:
-            current_bytes = await self.hass.async_add_executor_job(
-                self._device.read_value, bytes.fromhex(self._command), "get", 4, 4
-            )
-
-        # Modify only the relevant byte (start or end time)
-        schedule_bytes = bytearray(current_bytes)
-        if self._time_type == "start":
-            schedule_bytes[0] = new_num
-        else:  # "end"
-            schedule_bytes[1] = new_num
-
-        # Write the modified schedule back
-        async with self._device.lock:
-            await self.hass.async_add_executor_job(
+        # One lock hold for the whole read-modify-write, so a concurrent write
+        # of the sibling cannot be overwritten with its old half
+        async with self._device.async_exclusive():
+            # The register holds both start and end time; the other half comes
+            # from the last read shared with the sibling, read only if missing
+            current_bytes = self._last_raw
+            if current_bytes is None:
+                current_bytes = await self._device.async_run(
+                    self._device.read_value,
+                    self._command_bytes,
+                    "get",
+                    SCHEDULE_OFFSET,
+                    SCHEDULE_LENGTH,
+                )
+
+            # Modify only the relevant byte (start or end time)
+            schedule_bytes = bytearray(current_bytes)
+            if self._time_type == "start":
+                schedule_bytes[0] = new_num
+            else:  # "end"
+                schedule_bytes[1] = new_num
+
+            # Write the modified schedule back
+            await self._device.async_run(
                 self._device.write_value,
-                bytes.fromhex(self._command),
+                self._command_bytes,
                 bytes(schedule_bytes)
             )
-            # Short pause to ensure the device is ready
-            await asyncio.sleep(0.01)
-
+            self._store_raw(bytes(schedule_bytes))
         self._attr_native_value = t_value
+        self.async_write_ha_state()
+
+    def _store_raw(self, value_bytes: bytes) -> None:
+        """Remember the raw schedule register bytes for this entity and its sibling.
+
+        Args:
+            value_bytes: The 4 register bytes last read from or written to the device.
+        """
+        self._last_raw = value_bytes
+        if self._sibling is not None:
+            self._sibling._last_raw = value_bytes
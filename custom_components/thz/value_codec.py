@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 
-from .value_maps import SELECT_MAP
+from .value_maps import SELECT_MAP, SELECT_MAP_REVERSE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -80,20 +80,16 @@ class THZValueCodec:
         Raises:
             ValueError: If decode_type not found or option invalid.
         """
-        if decode_type not in SELECT_MAP:
+        reverse_map = SELECT_MAP_REVERSE.get(decode_type)
+        if reverse_map is None:
             raise ValueError(f"Unknown decode_type: {decode_type}")
 
-        # Create reverse mapping from option strings to numeric keys
-        # Note: Keys in SELECT_MAP are strings, possibly zero-padded
-        reverse_map = {v: k for k, v in SELECT_MAP[decode_type].items()}
-
-        if option not in reverse_map:
+        # Numeric values are converted from the (possibly zero-padded) string
+        # keys of SELECT_MAP once at import
+        value = reverse_map.get(option)
+        if value is None:
             raise ValueError(f"Invalid option '{option}' for decode_type '{decode_type}'")
 
-        # Get the string key and convert to int
-        key_str = reverse_map[option]
-        value = int(key_str)
-
         # Encode as single byte (little-endian as per original select.py)
         return value.to_bytes(1, byteorder="little", signed=False)
 
@@ -167,5 +163,5 @@ class THZValueCodec:
         if not value_bytes:
             raise ValueError("No data to decode")
 
-        value = int.from_bytes(value_bytes, byteorder="big", signed=False)
-        return value != 0
+        # Any set bit means "on"; no need to build an int first
+        return any(value_bytes)
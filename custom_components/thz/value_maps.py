@@ -79,3 +79,10 @@ SELECT_MAP = {
         "1": "on",
     },
 }
+
+# Reverse of SELECT_MAP (option string -> numeric value), built once at import
+# for encoding; where options repeat, the last numeric value wins
+SELECT_MAP_REVERSE = {
+    decode_type: {option: int(value) for value, option in options.items()}
+    for decode_type, options in SELECT_MAP.items()
+}
@@ -1,11 +1,21 @@
 """Pytest configuration and fixtures."""
 import sys
+from dataclasses import dataclass
 from unittest.mock import MagicMock, Mock
 
 # Create mock base classes to avoid metaclass conflicts
 class MockEntity:
     """Mock entity base class."""
-    pass
+
+    @property
+    def name(self):
+        """Return _attr_name, else the translation key HA would resolve."""
+        if getattr(self, "_attr_name", None) is not None:
+            return self._attr_name
+        return getattr(self, "_attr_translation_key", None)
+
+    async def async_will_remove_from_hass(self):
+        """Mirror the no-op Entity hook so subclasses can call super()."""
 
 class MockCoordinatorEntity(MockEntity):
     """Mock coordinator entity."""
@@ -40,6 +50,19 @@ class MockCalendarEntity(MockEntity):
     """Mock calendar entity."""
     pass
 
+@dataclass(frozen=True, kw_only=True)
+class MockSensorEntityDescription:
+    """Mock sensor entity description."""
+    key: str
+    name: str | None = None
+    native_unit_of_measurement: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
+    icon: str | None = None
+    translation_key: str | None = None
+    has_entity_name: bool = False
+    entity_registry_enabled_default: bool = True
+
 # Mock Home Assistant modules
 sys.modules['homeassistant'] = MagicMock()
 sys.modules['homeassistant.config_entries'] = MagicMock()
@@ -67,6 +90,7 @@ sys.modules['homeassistant.components'] = MagicMock()
 # Mock sensor component
 sensor_mock = MagicMock()
 sensor_mock.SensorEntity = MockSensorEntity
+sensor_mock.SensorEntityDescription = MockSensorEntityDescription
 sensor_mock.SensorDeviceClass = MagicMock()
 sensor_mock.SensorStateClass = MagicMock()
 sys.modules['homeassistant.components.sensor'] = sensor_mock
@@ -18,6 +18,7 @@ from custom_components.thz.const import (
     TIMEOUT,
     WRITE_REGISTER_LENGTH,
     WRITE_REGISTER_OFFSET,
+    entity_slug,
     should_hide_entity_by_default,
 )
 
@@ -66,6 +67,22 @@ class TestConstants:
         assert TIME_VALUE_UNSET == 128
 
 
+class TestEntitySlug:
+    """Tests for entity_slug function."""
+
+    def test_slug_lowercases_and_replaces_spaces(self):
+        """Test that names are lower-cased with spaces as underscores."""
+        assert entity_slug("programDHW Mo") == "programdhw_mo"
+        assert entity_slug("outsideTemp") == "outsidetemp"
+
+    def test_slug_is_cached(self):
+        """Test that repeated names are served from the cache."""
+        entity_slug.cache_clear()
+        entity_slug("flowTemp")
+        entity_slug("flowTemp")
+        assert entity_slug.cache_info().hits == 1
+
+
 class TestShouldHideEntityByDefault:
     """Tests for should_hide_entity_by_default function."""
 
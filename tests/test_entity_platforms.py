@@ -21,6 +21,73 @@ class TestNumberModule:
         from custom_components.thz.number import THZNumber
         assert THZNumber is not None
 
+    @staticmethod
+    def _number(data):
+        """Create a number reading from a coordinator holding data."""
+        from types import SimpleNamespace
+
+        from custom_components.thz.number import THZNumber
+
+        return THZNumber(
+            name="test number",
+            entry={"command": "0A0116", "min": 0, "max": 10, "decode_type": "1"},
+            device=object(),
+            device_id="device",
+            coordinator=SimpleNamespace(data=data),
+        )
+
+    def test_number_value_from_coordinator_data(self):
+        """Test that the number decodes its register and does not poll."""
+        number = self._number({b"\x0a\x01\x16": b"\x00\x07"})
+        assert number._attr_should_poll is False
+
+        number._update_from_coordinator()
+        assert number.native_value == 7
+
+        number.coordinator.data = {b"\x0a\x01\x16": None}
+        number._update_from_coordinator()
+        assert number.native_value == 7
+
+    def test_coordinator_entity_requires_a_decoder(self):
+        """Test that a coordinator entity without a decoder cannot be built."""
+        from types import SimpleNamespace
+
+        from custom_components.thz.base_entity import THZCoordinatorEntity
+
+        class _NoDecoder(THZCoordinatorEntity):
+            pass
+
+        with pytest.raises(TypeError):
+            _NoDecoder(
+                SimpleNamespace(data={}),
+                name="test",
+                command="0A0116",
+                device=object(),
+                device_id="device",
+            )
+
+    def test_write_coordinator_uses_write_interval(self):
+        """Test that the platform coordinator refreshes every write_interval."""
+        from datetime import timedelta
+        from unittest.mock import patch
+
+        from custom_components.thz import platform_setup
+
+        with patch.object(platform_setup, "DataUpdateCoordinator") as coordinator:
+            platform_setup.create_write_coordinator(
+                object(), object(), "THZ number", "90", [b"\x0a\x01\x16"]
+            )
+        assert coordinator.call_args.kwargs["update_interval"] == timedelta(
+            seconds=90
+        )
+
+    def test_number_links_device_info(self):
+        """Test that the device link is set once as an attribute."""
+        from custom_components.thz.const import DOMAIN
+
+        number = self._number({})
+        assert number._attr_device_info == {"identifiers": {(DOMAIN, "device")}}
+
 
 class TestSelectModule:
     """Test select module can be imported and has expected structure."""
@@ -40,6 +107,27 @@ class TestSelectModule:
         from custom_components.thz.select import THZSelect
         assert THZSelect is not None
 
+    def test_encode_select_round_trips_every_option(self):
+        """Test that every option encodes to a value decoding back to it."""
+        from custom_components.thz.value_codec import THZValueCodec
+        from custom_components.thz.value_maps import SELECT_MAP
+
+        for decode_type, options in SELECT_MAP.items():
+            for option in set(options.values()):
+                encoded = THZValueCodec.encode_select(option, decode_type)
+                assert THZValueCodec.decode_select(encoded, decode_type) == option
+
+        assert THZValueCodec.encode_select("summer", "SomWinMode") == b"\x02"
+
+    def test_encode_select_rejects_unknown_input(self):
+        """Test that unknown decode types and options raise ValueError."""
+        from custom_components.thz.value_codec import THZValueCodec
+
+        with pytest.raises(ValueError):
+            THZValueCodec.encode_select("automatic", "unknown")
+        with pytest.raises(ValueError):
+            THZValueCodec.encode_select("unknown", "2opmode")
+
 
 class TestSwitchModule:
     """Test switch module can be imported and has expected structure."""
@@ -59,6 +147,140 @@ class TestSwitchModule:
         from custom_components.thz.switch import THZSwitch
         assert THZSwitch is not None
 
+    @staticmethod
+    def _switch(data, **entry):
+        """Create a switch reading from a coordinator holding data."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from custom_components.thz.switch import THZSwitch
+
+        switch = THZSwitch(
+            name="test switch",
+            entry={"command": "0A0116", **entry},
+            device=object(),
+            device_id="device",
+            coordinator=SimpleNamespace(data=data),
+        )
+
+        def _create_task(coro):
+            return asyncio.get_running_loop().create_task(coro)
+
+        switch.hass = SimpleNamespace(async_create_task=_create_task)
+        return switch
+
+    def test_switch_state_from_coordinator_data(self):
+        """Test that the switch decodes its own register from shared data."""
+        switch = self._switch({b"\x0a\x01\x16": b"\x00\x01", b"\x0b": b"\x00\x00"})
+
+        switch._update_from_coordinator()
+        assert switch.is_on is True
+
+        switch.coordinator.data = {b"\x0a\x01\x16": b"\x00\x00"}
+        switch._update_from_coordinator()
+        assert switch.is_on is False
+
+    def test_switch_keeps_state_without_data(self):
+        """Test that a failed read keeps the previous state."""
+        switch = self._switch({b"\x0a\x01\x16": b"\x00\x01"})
+        switch._update_from_coordinator()
+
+        switch.coordinator.data = {b"\x0a\x01\x16": None}
+        switch._update_from_coordinator()
+        assert switch.is_on is True
+
+    def test_write_only_switch_is_assumed_state(self):
+        """Test that write-only switches are flagged and default to polled."""
+        assert self._switch({}).write_only is False
+        assert self._switch({})._attr_assumed_state is False
+
+        switch = self._switch({}, write_only=True)
+        assert switch.write_only is True
+        assert switch._attr_assumed_state is True
+
+    def test_turn_on_and_off_write_the_encoded_state(self):
+        """Test that turn on/off share one write path and update the state."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        from custom_components.thz.value_codec import THZValueCodec
+
+        switch = self._switch({})
+        switch._device = MagicMock(submit_write=AsyncMock())
+        switch.async_write_ha_state = MagicMock()
+
+        asyncio.run(switch.async_turn_on())
+        assert switch.is_on is True
+        switch._device.submit_write.assert_awaited_with(
+            b"\x0a\x01\x16", THZValueCodec.encode_switch(True)
+        )
+
+        asyncio.run(switch.async_turn_off())
+        assert switch.is_on is False
+        switch._device.submit_write.assert_awaited_with(
+            b"\x0a\x01\x16", THZValueCodec.encode_switch(False)
+        )
+        assert switch.async_write_ha_state.call_count == 2
+
+    def test_rapid_turn_on_off_is_coalesced(self):
+        """Test that requests in one debounce window cause a single write."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        from custom_components.thz.value_codec import THZValueCodec
+
+        switch = self._switch({})
+        switch._device = MagicMock(submit_write=AsyncMock())
+        switch.async_write_ha_state = MagicMock()
+
+        async def _toggle():
+            await asyncio.gather(
+                switch.async_turn_on(),
+                switch.async_turn_off(),
+                switch.async_turn_on(),
+            )
+
+        asyncio.run(_toggle())
+        switch._device.submit_write.assert_awaited_once_with(
+            b"\x0a\x01\x16", THZValueCodec.encode_switch(True)
+        )
+        assert switch.is_on is True
+        assert switch._write_task is None
+
+    def test_removal_cancels_pending_write(self):
+        """Test that removing the entity drops a write still in its window."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        switch = self._switch({})
+        switch._device = MagicMock(submit_write=AsyncMock())
+
+        async def _turn_on_then_remove():
+            turn_on = asyncio.ensure_future(switch.async_turn_on())
+            await asyncio.sleep(0)
+            await switch.async_will_remove_from_hass()
+            with pytest.raises(asyncio.CancelledError):
+                await turn_on
+
+        asyncio.run(_turn_on_then_remove())
+        switch._device.submit_write.assert_not_awaited()
+        assert switch._write_task is None
+
+    def test_write_error_keeps_previous_state(self):
+        """Test that a failed write is logged and leaves the state unchanged."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        switch = self._switch({})
+        switch._device = MagicMock(
+            submit_write=AsyncMock(side_effect=TimeoutError("no answer"))
+        )
+        switch.async_write_ha_state = MagicMock()
+
+        asyncio.run(switch.async_turn_on())
+        assert switch.is_on is False
+        switch.async_write_ha_state.assert_not_called()
+
 
 class TestCalendarModule:
     """Test calendar module can be imported and has expected structure."""
@@ -78,6 +300,35 @@ class TestCalendarModule:
         from custom_components.thz.calendar import THZCalendar
         assert THZCalendar is not None
 
+    def test_schedule_read_runs_in_the_device_executor(self):
+        """Test that the blocking register read goes through async_run."""
+        import asyncio
+        from contextlib import asynccontextmanager
+        from datetime import time
+        from unittest.mock import MagicMock
+
+        from custom_components.thz.calendar import THZSchedule
+
+        device = MagicMock()
+        device.read_value.return_value = b"\x20\x44\x00\x00"
+        run_calls = []
+
+        @asynccontextmanager
+        async def _exclusive():
+            yield
+
+        async def _run(func, *args):
+            run_calls.append(func)
+            return func(*args)
+
+        device.async_exclusive = _exclusive
+        device.async_run = _run
+        schedule = THZSchedule("programHC1_Mo_0", "0B1410", device, None, None)
+
+        times = asyncio.run(schedule.get_schedule_times_from_device())
+        assert times == (time(8, 0), time(17, 0))
+        assert run_calls == [device.read_value]
+
 
 class TestTimeModule:
     """Test time module can be imported and has expected structure."""
@@ -103,6 +354,199 @@ class TestTimeModule:
         assert callable(quarters_to_time)
         assert callable(time_to_quarters)
 
+    @staticmethod
+    def _schedule_pair():
+        """Create linked start/end schedule entities on a mocked device."""
+        import asyncio
+        from contextlib import asynccontextmanager
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        from custom_components.thz.time import _create_time_entities
+
+        device = MagicMock()
+        lock = asyncio.Lock()
+
+        @asynccontextmanager
+        async def _exclusive():
+            async with lock:
+                yield
+
+        device.async_exclusive = _exclusive
+
+        async def _run(func, *args):
+            return func(*args)
+
+        device.async_run = _run
+        device.read_value.return_value = b"\x20\x44\x00\x00"
+        entry = {"command": "0B1410", "type": "schedule"}
+        coordinator = SimpleNamespace(data={})
+        start, end = _create_time_entities(
+            "programHC1_Mo_0", entry, device, "device", coordinator
+        )
+        for entity in (start, end):
+            entity.async_write_ha_state = MagicMock()
+        return device, start, end
+
+    @staticmethod
+    def _time_entities(device):
+        """Create a regular time entity on a mocked device."""
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        from custom_components.thz.time import _create_time_entities
+
+        entry = {"command": "0A0116", "type": "time"}
+        entities = _create_time_entities(
+            "test time", entry, device, "device", SimpleNamespace(data={})
+        )
+        for entity in entities:
+            entity.async_write_ha_state = MagicMock()
+        return entities
+
+    def test_time_value_from_coordinator_data(self):
+        """Test that a regular time entity decodes its coordinator data."""
+        from datetime import time
+        from unittest.mock import MagicMock
+
+        (entity,) = self._time_entities(MagicMock())
+        assert entity._attr_should_poll is False
+        entity.coordinator.data = {b"\x0a\x01\x16": b"\x32\x00"}
+        entity._update_from_coordinator()
+        assert entity.native_value == time(12, 30)
+
+    def test_time_set_stores_the_written_quarter(self):
+        """Test that a set value is floored to the quarter that is written."""
+        import asyncio
+        from datetime import time
+
+        device, _start, _end = self._schedule_pair()
+        (entity,) = self._time_entities(device)
+        asyncio.run(entity.async_set_native_value("12:40"))
+        device.write_value.assert_called_once_with(b"\x0a\x01\x16", b"\x32\x00")
+        assert entity.native_value == time(12, 30)
+
+        asyncio.run(entity.async_set_native_value(None))
+        device.write_value.assert_called_with(b"\x0a\x01\x16", b"\x80\x00")
+        assert entity.native_value is None
+
+    def test_setup_reads_each_schedule_register_once(self):
+        """Test that coordinators get their register lists when created."""
+        import asyncio
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from custom_components.thz import time as time_platform
+        from custom_components.thz.const import DOMAIN
+
+        registers = {
+            "programHC1_Mo_0": {"command": "0B1410", "type": "schedule"},
+            "programHC1_Tu_0": {"command": "0B1420", "type": "schedule"},
+            "pClockHour": {"command": "0A0122", "type": "time"},
+            "pOpMode": {"command": "0A0112", "type": "select"},
+        }
+        write_manager = MagicMock()
+        write_manager.get_all_registers.return_value = registers
+        hass = SimpleNamespace(
+            data={
+                DOMAIN: {
+                    "write_manager": write_manager,
+                    "device": MagicMock(),
+                    "device_id": "device",
+                }
+            }
+        )
+        created = []
+
+        def _create(hass, device, name, interval, commands, *args):
+            created.append((name, list(commands), args))
+            return SimpleNamespace(data=None, async_refresh=AsyncMock())
+
+        add_entities = MagicMock()
+        with patch.object(time_platform, "create_write_coordinator", _create):
+            asyncio.run(
+                time_platform.async_setup_entry(
+                    hass, SimpleNamespace(data={}), add_entities
+                )
+            )
+
+        assert created == [
+            (
+                "THZ schedules",
+                [b"\x0b\x14\x10", b"\x0b\x14\x20"],
+                (time_platform.SCHEDULE_OFFSET, time_platform.SCHEDULE_LENGTH),
+            ),
+            ("THZ time", [b"\x0a\x01\x22"], ()),
+        ]
+        assert [len(call.args[0]) for call in add_entities.call_args_list] == [4, 1]
+
+    def test_schedule_pair_decodes_shared_register(self):
+        """Test that start and end decode their half of one coordinator read."""
+        from datetime import time
+
+        _device, start, end = self._schedule_pair()
+        start.coordinator.data = {b"\x0b\x14\x10": b"\x20\x44\x00\x00"}
+
+        start._update_from_coordinator()
+        end._update_from_coordinator()
+        assert start.native_value == time(8, 0)
+        assert end.native_value == time(17, 0)
+        assert start._attr_should_poll is False
+        assert start._attr_unique_id == (
+            "thz_schedule_time_0b1410_programhc1_mo_0_start_start"
+        )
+        assert end._attr_unique_id == "thz_schedule_time_0b1410_programhc1_mo_0_end_end"
+
+    def test_schedule_write_reuses_sibling_read(self):
+        """Test that setting one half reuses the register read by its sibling."""
+        import asyncio
+
+        device, start, end = self._schedule_pair()
+        end.coordinator.data = {b"\x0b\x14\x10": b"\x20\x44\x00\x00"}
+        end._update_from_coordinator()
+
+        asyncio.run(start.async_set_native_value("09:00"))
+        device.read_value.assert_not_called()
+        device.write_value.assert_called_once_with(
+            b"\x0b\x14\x10", b"\x24\x44\x00\x00"
+        )
+
+        asyncio.run(end.async_set_native_value("18:00"))
+        device.read_value.assert_not_called()
+        device.write_value.assert_called_with(
+            b"\x0b\x14\x10", b"\x24\x48\x00\x00"
+        )
+
+    def test_concurrent_schedule_writes_keep_both_halves(self):
+        """Test that concurrent start and end writes do not undo each other."""
+        import asyncio
+
+        device, start, end = self._schedule_pair()
+        start.coordinator.data = {b"\x0b\x14\x10": b"\x20\x44\x00\x00"}
+        start._update_from_coordinator()
+
+        async def _set_both():
+            await asyncio.gather(
+                start.async_set_native_value("09:00"),
+                end.async_set_native_value("18:00"),
+            )
+
+        asyncio.run(_set_both())
+        device.write_value.assert_called_with(
+            b"\x0b\x14\x10", b"\x24\x48\x00\x00"
+        )
+
+    def test_schedule_write_reads_register_when_not_cached(self):
+        """Test that the first write without a prior read reads the register."""
+        import asyncio
+
+        device, start, _end = self._schedule_pair()
+        asyncio.run(start.async_set_native_value("09:00"))
+        device.read_value.assert_called_once_with(b"\x0b\x14\x10", "get", 4, 4)
+        device.write_value.assert_called_once_with(
+            b"\x0b\x14\x10", b"\x24\x44\x00\x00"
+        )
+
 
 class TestConfigFlowModule:
     """Test config_flow module can be imported and has expected structure."""
@@ -142,6 +586,27 @@ class TestInitModule:
         from custom_components.thz import async_unload_entry
         assert callable(async_unload_entry)
 
+    def test_migrate_legacy_sensor_unique_id(self):
+        """Test that bytes-repr sensor unique_ids are migrated to hex."""
+        from custom_components.thz import _migrate_sensor_unique_id
+
+        assert (
+            _migrate_sensor_unique_id("thz_b'\\xfb'_4_outside_temp")
+            == "thz_fb_4_outside_temp"
+        )
+        assert (
+            _migrate_sensor_unique_id("thz_b'\\n_'_0_some_value")
+            == "thz_0a5f_0_some_value"
+        )
+        assert _migrate_sensor_unique_id('thz_b"\'"_2_x') == "thz_27_2_x"
+
+    def test_current_unique_ids_are_not_migrated(self):
+        """Test that unique_ids without a bytes repr are left alone."""
+        from custom_components.thz import _migrate_sensor_unique_id
+
+        assert _migrate_sensor_unique_id("thz_fb_4_outside_temp") is None
+        assert _migrate_sensor_unique_id("thz_set_0a0116_room_temp") is None
+
 
 class TestModuleConstants:
     """Test module-level constants and configurations."""
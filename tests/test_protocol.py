@@ -167,7 +167,7 @@ class TestCaching:
         
         # Manually populate cache
         import time
-        device._cache[block] = (time.time(), cached_data)
+        device._cache[block] = (time.monotonic(), cached_data)
         
         # Should return cached data
         result = device.read_block_cached(block, cache_duration=60)
@@ -181,7 +181,7 @@ class TestCaching:
         
         # Populate cache with old timestamp
         import time
-        device._cache[block] = (time.time() - 100, cached_data)
+        device._cache[block] = (time.monotonic() - 100, cached_data)
         
         # Cache should be expired with duration of 60 seconds
         # This will try to read from device, which should raise an exception without a connection
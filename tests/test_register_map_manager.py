@@ -7,6 +7,8 @@ from custom_components.thz.register_maps.register_map_manager import (
     BaseRegisterMapManager,
     RegisterMapManager,
     RegisterMapManagerWrite,
+    SensorField,
+    build_sensor_fields,
 )
 
 
@@ -128,6 +130,61 @@ class TestRegisterMapManager:
         assert manager_214.get_firmware_version() == "214"
 
 
+class TestRegistersByType:
+    """Test write registers grouped by type."""
+
+    def test_registers_by_type_match_full_map(self):
+        """Test that grouping by type keeps every register of that type."""
+        manager = RegisterMapManagerWrite("539")
+        all_registers = manager.get_all_registers()
+
+        for register_type in ("switch", "number", "select", "time"):
+            expected = {
+                name: entry
+                for name, entry in all_registers.items()
+                if entry.get("type") == register_type
+            }
+            assert manager.get_registers_by_type(register_type) == expected
+        assert manager.get_registers_by_type("switch")
+
+    def test_unknown_type_is_empty(self):
+        """Test that an unknown register type yields no registers."""
+        manager = RegisterMapManagerWrite("539")
+        assert manager.get_registers_by_type("does_not_exist") == {}
+
+
+class TestSensorFields:
+    """Test read registers normalized for decoding."""
+
+    def test_build_sensor_fields_converts_to_bytes(self):
+        """Test that nibble offsets/lengths become byte units and names are cleaned."""
+        fields = build_sensor_fields(
+            {
+                "pxxFB": [
+                    (" outsideTemp: ", 8, 4, "hex2int", 10),
+                    ("bit", 5, 1, "bit0", 1),
+                ]
+            }
+        )
+
+        assert fields == {
+            "pxxFB": (
+                SensorField("outsideTemp", 4, 2, "hex2int", 10),
+                SensorField("bit", 2, 1, "bit0", 1),
+            )
+        }
+
+    def test_manager_fields_match_registers(self):
+        """Test that the manager precomputes fields for every read block."""
+        manager = RegisterMapManager("539")
+        fields = manager.get_sensor_fields()
+
+        assert fields.keys() == manager.get_all_registers().keys()
+        assert manager.get_sensor_fields() is fields
+        for block, entries in manager.get_all_registers().items():
+            assert len(fields[block]) == len(entries)
+
+
 class TestRegisterMapManagerWrite:
     """Test RegisterMapManagerWrite class."""
 
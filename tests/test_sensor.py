@@ -215,3 +215,394 @@ class TestDuplicateSensorHandling:
         
         is_duplicate = sensor_name2 in seen_sensor_names
         assert not is_duplicate
+
+
+class TestAsyncSetupEntryDeduplication:
+    """Tests for sensor creation in async_setup_entry."""
+
+    @staticmethod
+    def _setup(registers, coordinators, registry_entries=()):
+        """Run async_setup_entry against a mocked hass and return the sensors."""
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from custom_components.thz.const import DOMAIN
+        from custom_components.thz.register_maps.register_map_manager import (
+            build_sensor_fields,
+        )
+        from custom_components.thz.sensor import async_setup_entry
+
+        register_manager = MagicMock()
+        register_manager.get_sensor_fields.return_value = build_sensor_fields(
+            registers
+        )
+        config_entry = MagicMock()
+        config_entry.entry_id = "entry"
+        hass = MagicMock()
+        hass.data = {
+            DOMAIN: {
+                "register_manager": register_manager,
+                "device_id": "device",
+                "entry": {"coordinators": coordinators},
+            }
+        }
+        added = []
+        with patch(
+            "custom_components.thz.sensor.er.async_entries_for_config_entry",
+            return_value=list(registry_entries),
+        ):
+            asyncio.run(
+                async_setup_entry(hass, config_entry, lambda e, *_: added.extend(e))
+            )
+        return added
+
+    def test_first_occurrence_wins(self):
+        """Test that a name repeated across blocks is created only once."""
+        sensors = self._setup(
+            {
+                "pxxFB": [("outsideTemp:", 8, 4, "hex2int", 10)],
+                "pxxF4": [
+                    ("outsideTemp", 4, 4, "hex2int", 10),
+                    ("flowTemp:", 12, 4, "hex2int", 10),
+                ],
+            },
+            {"pxxFB": object(), "pxxF4": object()},
+        )
+
+        assert [s._entity_name for s in sensors] == ["outsideTemp", "flowTemp"]
+        assert sensors[0]._block == b"\xfb"
+        assert sensors[0]._offset == 4
+        assert sensors[0]._length == 2
+
+    def test_block_without_coordinator_is_skipped(self):
+        """Test that names from unpolled blocks do not shadow later blocks."""
+        sensors = self._setup(
+            {
+                "pxxFB": [("outsideTemp:", 8, 4, "hex2int", 10)],
+                "pxxF4": [("outsideTemp:", 4, 4, "hex2int", 10)],
+            },
+            {"pxxF4": object()},
+        )
+
+        assert len(sensors) == 1
+        assert sensors[0]._block == b"\xf4"
+
+    def test_disabled_registry_entries_are_not_created(self):
+        """Test that sensors disabled in the entity registry are skipped."""
+        from types import SimpleNamespace
+
+        sensors = self._setup(
+            {
+                "pxxFB": [
+                    ("outsideTemp", 8, 4, "hex2int", 10),
+                    ("flowTemp", 12, 4, "hex2int", 10),
+                    ("returnTemp", 16, 4, "hex2int", 10),
+                ]
+            },
+            {"pxxFB": object()},
+            registry_entries=[
+                SimpleNamespace(
+                    unique_id="thz_fb_4_outsidetemp", disabled_by="integration"
+                ),
+                SimpleNamespace(unique_id="thz_fb_6_flowtemp", disabled_by=None),
+            ],
+        )
+
+        assert [s._entity_name for s in sensors] == ["flowTemp", "returnTemp"]
+
+    def test_duplicates_logged_once(self, caplog):
+        """Test that skipped duplicate names are reported in one debug log."""
+        import logging
+
+        with caplog.at_level(logging.DEBUG, logger="custom_components.thz.sensor"):
+            self._setup(
+                {
+                    "pxxFB": [
+                        ("outsideTemp:", 8, 4, "hex2int", 10),
+                        ("flowTemp", 12, 4, "hex2int", 10),
+                    ],
+                    "pxxF4": [
+                        ("outsideTemp", 4, 4, "hex2int", 10),
+                        ("flowTemp:", 6, 4, "hex2int", 10),
+                    ],
+                },
+                {"pxxFB": object(), "pxxF4": object()},
+            )
+
+        messages = [r.getMessage() for r in caplog.records if "duplicate" in r.message]
+        assert messages == ["Skipped 2 duplicate sensor names: outsideTemp, flowTemp"]
+
+
+class TestBuildDecoder:
+    """Tests for the per-sensor decoder built at construction time."""
+
+    def test_decoder_matches_decode_value(self):
+        """Test that built decoders agree with decode_value."""
+        from custom_components.thz.sensor import build_decoder, decode_value
+
+        cases = [
+            (b"\xff\x9c", "hex2int", 10),
+            (b"\x01\x00", "hex", 1),
+            (b"\x08", "bit3", 1),
+            (b"\x08", "nbit3", 1),
+            (b"\x41\x20\x00\x00", "esp_mant", 1),
+            (b"\xde\xad", "raw", 1),
+        ]
+        for raw, decode_type, factor in cases:
+            decoder = build_decoder(decode_type, factor)
+            assert decoder(raw) == decode_value(raw, decode_type, factor)
+
+    def test_struct_decoders_match_int_from_bytes(self):
+        """Test that length-specialised decoders agree with the generic ones."""
+        from custom_components.thz.sensor import build_decoder
+
+        cases = [
+            (b"\xff\x9c", "hex2int", 10),
+            (b"\xff\xff\xff\x9c", "hex2int", 10),
+            (b"\x01\x00", "hex", 1),
+            (b"\x80\x00\x00\x01", "hex", 1),
+        ]
+        for raw, decode_type, factor in cases:
+            view = memoryview(raw)
+            generic = build_decoder(decode_type, factor)
+            specialised = build_decoder(decode_type, factor, len(raw))
+            assert specialised(view) == generic(raw)
+
+    def test_bit_and_nbit_decoders(self):
+        """Test that bitX and nbitX select and negate the same bit."""
+        from custom_components.thz.sensor import build_decoder
+
+        for bitnum in range(8):
+            raw = bytes([1 << bitnum])
+            assert build_decoder(f"bit{bitnum}")(raw) is True
+            assert build_decoder(f"nbit{bitnum}")(raw) is False
+            assert build_decoder(f"bit{bitnum}")(b"\x00") is False
+            assert build_decoder(f"nbit{bitnum}")(b"\x00") is True
+
+    def test_invalid_bit_number_raises_at_build_time(self):
+        """Test that malformed bit types are rejected when building."""
+        from custom_components.thz.sensor import build_decoder
+
+        with pytest.raises(ValueError):
+            build_decoder("bitX")
+
+
+class TestBlockDecoder:
+    """Tests for decoding all sensors of a block in one pass."""
+
+    def test_values_are_cached_until_payload_changes(self):
+        """Test that a payload is decoded once and shared by all fields."""
+        from unittest.mock import Mock
+
+        from custom_components.thz.sensor import BlockDecoder
+
+        block_decoder = BlockDecoder()
+        first = Mock(side_effect=lambda raw: bytes(raw))
+        second = Mock(side_effect=lambda raw: bytes(raw))
+        assert block_decoder.add(0, 1, first) == 0
+        assert block_decoder.add(1, 2, second) == 1
+
+        payload = b"\x01\x02\x03"
+        assert block_decoder.decode(payload) == [b"\x01", b"\x02\x03"]
+        assert block_decoder.decode(payload) == [b"\x01", b"\x02\x03"]
+        assert first.call_count == 1
+        assert second.call_count == 1
+
+        assert block_decoder.decode(b"\x04\x05\x06") == [b"\x04", b"\x05\x06"]
+        assert first.call_count == 2
+
+    def test_failed_fields_do_not_affect_others(self):
+        """Test that short payloads and decode errors are kept per field."""
+        from custom_components.thz.sensor import (
+            PAYLOAD_TOO_SHORT,
+            BlockDecoder,
+            build_decoder,
+        )
+
+        block_decoder = BlockDecoder()
+        block_decoder.add(0, 2, build_decoder("hex"))
+        block_decoder.add(0, 0, build_decoder("bit0"))
+        block_decoder.add(2, 2, build_decoder("hex"))
+
+        values = block_decoder.decode(b"\x01\x00\x02")
+        assert values[0] == 0x0100
+        assert isinstance(values[1], IndexError)
+        assert values[2] is PAYLOAD_TOO_SHORT
+
+    def test_bit_fields_grouped_by_offset(self):
+        """Test that bit fields on one byte are decoded from a single read."""
+        from custom_components.thz.sensor import (
+            PAYLOAD_TOO_SHORT,
+            BlockDecoder,
+            parse_bit_type,
+        )
+
+        block_decoder = BlockDecoder()
+        indexes = [
+            block_decoder.add_bit(1, *parse_bit_type(decode_type))
+            for decode_type in ("bit0", "nbit0", "bit3", "nbit7")
+        ]
+        short = block_decoder.add_bit(2, *parse_bit_type("bit0"))
+
+        values = block_decoder.decode(b"\x00\x09")
+        assert [values[i] for i in indexes] == [True, False, True, True]
+        assert values[short] is PAYLOAD_TOO_SHORT
+        assert list(block_decoder._bit_groups) == [1, 2]
+
+    def test_sensors_share_block_decoder(self):
+        """Test that sensors of one block read from the same decoded list."""
+        from types import SimpleNamespace
+
+        from custom_components.thz.sensor import BlockDecoder, THZGenericSensor
+
+        payload = b"\x00\x64\xff\x9c"
+        coordinator = SimpleNamespace(data={b"\xfb": payload})
+        block_decoder = BlockDecoder()
+        sensors = [
+            THZGenericSensor(
+                coordinator,
+                entry=(name, offset, 2, "hex2int", 10),
+                block=b"\xfb",
+                device_id="device",
+                block_decoder=block_decoder,
+            )
+            for name, offset in (("first", 0), ("second", 2))
+        ]
+
+        assert [s.native_value for s in sensors] == [10.0, -10.0]
+        assert block_decoder.decode(payload) == [10.0, -10.0]
+
+    def test_sensor_reads_its_block_from_shared_coordinator(self):
+        """Test that a sensor only uses its own block's payload."""
+        from types import SimpleNamespace
+
+        from custom_components.thz.sensor import THZGenericSensor
+
+        coordinator = SimpleNamespace(
+            data={b"\xfb": b"\x00\x64", b"\xf4": None}
+        )
+        sensor = THZGenericSensor(
+            coordinator,
+            entry=("first", 0, 2, "hex2int", 10),
+            block=b"\xf4",
+            device_id="device",
+        )
+        assert sensor.native_value is None
+
+        sensor._block = b"\xfb"
+        assert sensor.native_value == 10.0
+
+    def test_decoders_accept_memoryview_slices(self):
+        """Test that every decoder works on a memoryview slice."""
+        from custom_components.thz.sensor import build_decoder
+
+        view = memoryview(b"\x00\xff\x9c\x41\x20\x00\x00")
+        assert build_decoder("hex2int", 10)(view[1:3]) == -10.0
+        assert build_decoder("hex")(view[1:3]) == 0xFF9C
+        assert build_decoder("bit7")(view[1:2]) is True
+        assert build_decoder("esp_mant")(view[3:7]) == 10.0
+        assert build_decoder("raw")(view[1:3]) == "ff9c"
+
+
+class TestGenericSensorAttributes:
+    """Tests for attributes precomputed in THZGenericSensor.__init__."""
+
+    def test_static_attributes_set_once(self):
+        """Test that entity properties come from the entity description."""
+        from custom_components.thz.const import DOMAIN
+        from custom_components.thz.sensor import THZGenericSensor
+
+        sensor = THZGenericSensor(
+            object(),
+            entry={
+                "name": "outside Temp",
+                "offset": 4,
+                "length": 2,
+                "decode": "hex2int",
+                "factor": 10,
+                "unit": "°C",
+                "device_class": "temperature",
+                "state_class": "measurement",
+                "icon": "mdi:thermometer",
+                "translation_key": "outside_temp",
+            },
+            block=b"\xfb",
+            device_id="device",
+        )
+
+        assert sensor._attr_unique_id == "thz_fb_4_outside_temp"
+        assert sensor._attr_device_info == {"identifiers": {(DOMAIN, "device")}}
+        description = sensor.entity_description
+        assert description.native_unit_of_measurement == "°C"
+        assert description.device_class == "temperature"
+        assert description.state_class == "measurement"
+        assert description.icon == "mdi:thermometer"
+        assert description.translation_key == "outside_temp"
+        assert description.has_entity_name is True
+        assert not hasattr(sensor, "_attr_name")
+
+    def test_known_sensors_share_description(self):
+        """Test that sensors from SENSOR_META reuse the shared description."""
+        from custom_components.thz.sensor import (
+            SENSOR_DESCRIPTIONS,
+            THZGenericSensor,
+        )
+
+        entry = {
+            "name": "outsideTemp",
+            "offset": 4,
+            "length": 2,
+            "decode": "hex2int",
+            "factor": 10,
+        }
+        first = THZGenericSensor(object(), entry=entry, block=b"\xfb", device_id="d")
+        second = THZGenericSensor(object(), entry=entry, block=b"\xfc", device_id="d")
+
+        assert first.entity_description is SENSOR_DESCRIPTIONS["outsideTemp"]
+        assert second.entity_description is first.entity_description
+        assert first.entity_description.native_unit_of_measurement == "°C"
+
+    def test_untranslated_sensor_uses_name(self):
+        """Test that sensors without a translation key fall back to _attr_name."""
+        from custom_components.thz.sensor import THZGenericSensor
+
+        sensor = THZGenericSensor(
+            object(),
+            entry=("p99RoomTempDay", 0, 4, "hex2int", 10),
+            block=b"\x0b",
+            device_id="d",
+        )
+
+        assert sensor._attr_name == "p99RoomTempDay"
+        assert sensor.entity_description.translation_key is None
+        assert sensor.entity_description.has_entity_name is False
+
+
+class TestGenericSensorErrorLogging:
+    """Tests for decode error logging in THZGenericSensor.native_value."""
+
+    def test_traceback_logged_only_for_first_error(self, caplog):
+        """Test that repeated decode errors are logged without traceback."""
+        import logging
+        from unittest.mock import MagicMock
+
+        from custom_components.thz.sensor import THZGenericSensor
+
+        coordinator = MagicMock()
+        coordinator.data = {b"\xfb": b"\x00\x00\x00\x00"}
+        # A zero-length bit field raises IndexError on every decode
+        sensor = THZGenericSensor(
+            coordinator,
+            entry=("brokenSensor", 0, 0, "bit0", 1),
+            block=b"\xfb",
+            device_id="device",
+        )
+
+        with caplog.at_level(logging.ERROR, logger="custom_components.thz.sensor"):
+            assert sensor.native_value is None
+            coordinator.data = {b"\xfb": b"\x00\x00\x00\x01"}
+            assert sensor.native_value is None
+
+        assert len(caplog.records) == 2
+        assert caplog.records[0].exc_info is not None
+        assert not caplog.records[1].exc_info
@@ -97,6 +97,387 @@ class TestTHZDeviceInitialization:
         assert device._min_interval == 0.1
 
 
+class TestTHZDeviceIOThread:
+    """Tests for the dedicated device I/O thread."""
+
+    def test_async_run_uses_one_device_thread(self):
+        """Test that blocking calls run on the same dedicated thread."""
+        import asyncio
+        import threading
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+
+        async def run():
+            names = [
+                await device.async_run(lambda: threading.current_thread().name)
+                for _ in range(3)
+            ]
+            await device.async_close()
+            return names
+
+        names = asyncio.run(run())
+        assert len(set(names)) == 1
+        assert names[0].startswith("thz_io")
+
+
+class TestTHZDeviceExclusive:
+    """Tests for the settle pause between device exchanges."""
+
+    def test_settle_pause_only_between_back_to_back_exchanges(self):
+        """Test that only an exchange started too early waits."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+
+        async def run():
+            with patch(
+                "custom_components.thz.thz_device.asyncio.sleep", new=AsyncMock()
+            ) as sleep:
+                async with device.async_exclusive():
+                    pass
+                first = sleep.await_count
+                async with device.async_exclusive():
+                    assert device.lock.locked()
+                return first, sleep.await_args_list
+
+        first, calls = asyncio.run(run())
+        assert first == 0
+        assert len(calls) == 1
+        assert 0 < calls[0].args[0] <= device._settle_time
+        assert not device.lock.locked()
+
+    def test_exchange_records_last_access(self):
+        """Test that finishing an exchange records its time for diagnostics."""
+        import asyncio
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+        assert device.last_access is None
+
+        async def run():
+            async with device.async_exclusive():
+                pass
+
+        asyncio.run(run())
+        assert device.last_access is not None
+        assert device.last_access.timestamp() == pytest.approx(device._last_access)
+
+
+class TestTHZDeviceReadValues:
+    """Tests for reading several registers in one call."""
+
+    def test_read_values_keeps_successful_reads(self):
+        """Test that a failing register maps to None without losing others."""
+        from unittest.mock import patch
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+
+        def read_value(addr_bytes, get_or_set, offset, length):
+            if addr_bytes == b"\x0b":
+                raise ValueError("no response")
+            return addr_bytes + b"\x01"
+
+        with patch.object(device, "read_value", side_effect=read_value):
+            values = device.read_values([b"\x0a", b"\x0b", b"\x0c"], "get", 4, 2)
+
+        assert values == {
+            b"\x0a": b"\x0a\x01",
+            b"\x0b": None,
+            b"\x0c": b"\x0c\x01",
+        }
+
+    def test_read_blocks_keeps_successful_reads(self):
+        """Test that a failing block maps to None without losing others."""
+        from unittest.mock import patch
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+
+        def read_block(addr_bytes, get_or_set):
+            if addr_bytes == b"\xf4":
+                raise RuntimeError("timeout")
+            return addr_bytes + b"\x01"
+
+        with patch.object(device, "read_block", side_effect=read_block):
+            payloads = device.read_blocks([b"\xfb", b"\xf4"])
+
+        assert payloads == {b"\xfb": b"\xfb\x01", b"\xf4": None}
+
+
+class TestTHZDeviceSocketReads:
+    """Tests for blocking socket reads with a deadline."""
+
+    def test_read_exact_waits_for_data(self):
+        """Test that reads return the requested bytes and then time out."""
+        import socket
+
+        device = THZDevice(connection="ip", host="localhost", tcp_port=2000)
+        device.ser, peer = socket.socketpair()
+        try:
+            peer.sendall(b"\x10\x02\x01")
+            assert device._read_exact(2, 1.0) == b"\x10\x02"
+            assert device._read_exact(2, 0.05) == b"\x01"
+        finally:
+            device.ser.close()
+            peer.close()
+
+    def test_read_frame_reads_until_terminator(self):
+        """Test that a telegram split over several sends is reassembled."""
+        import socket
+        import threading
+
+        device = THZDevice(connection="ip", host="localhost", tcp_port=2000)
+        device.ser, peer = socket.socketpair()
+        frame = b"\x01\x00\xfc\xfb\x00\x01\x10\x03"
+        sender = threading.Timer(0.01, peer.sendall, args=(frame[4:],))
+        try:
+            peer.sendall(frame[:4])
+            sender.start()
+            assert device._read_frame(1.0) == frame
+            with pytest.raises(RuntimeError):
+                device._read_frame(0.05)
+        finally:
+            sender.join()
+            device.ser.close()
+            peer.close()
+
+    def test_read_frame_from_serial_port(self):
+        """Test that serial telegrams are read into the reused buffer."""
+        import io
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+        frame = b"\x01\x00\xfc\xfb\x00\x01\x10\x03"
+        device.ser = io.BytesIO(frame)
+        device.ser.in_waiting = 3
+
+        assert device._read_frame(1.0) == frame
+        assert device._rxbuf[: len(frame)] == frame
+
+    def test_connection_check_keeps_socket_timeout(self):
+        """Test that the health check detects a closed peer without mode flips."""
+        import socket
+
+        device = THZDevice(connection="ip", host="localhost", tcp_port=2000)
+        device.ser, peer = socket.socketpair()
+        device.ser.settimeout(2.0)
+        try:
+            assert device._is_connection_alive() is True
+            peer.close()
+            assert device._is_connection_alive() is False
+            assert device.ser.gettimeout() == 2.0
+        finally:
+            device.ser.close()
+
+    def test_serial_io_uses_port_methods(self):
+        """Test that USB devices use the serial API whatever ser exposes."""
+        from unittest.mock import MagicMock
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+        device.ser = MagicMock()
+        device.ser.in_waiting = 0
+        device.ser.read.return_value = b"\x10"
+
+        device._write_bytes(b"\x02")
+        assert device._read_available(1.0) == b"\x10"
+        device._reset_input_buffer()
+
+        device.ser.write.assert_called_once_with(b"\x02")
+        device.ser.flush.assert_called_once()
+        device.ser.read.assert_called_once_with(1)
+        device.ser.reset_input_buffer.assert_called_once()
+        device.ser.send.assert_not_called()
+
+    def test_io_without_connection_raises(self):
+        """Test that I/O before connecting reports a connection error."""
+        device = THZDevice(connection="ip", host="localhost", tcp_port=2000)
+        with pytest.raises(ConnectionError):
+            device._write_bytes(b"\x02")
+        with pytest.raises(ConnectionError):
+            device._read_available(0.01)
+
+    def test_tcp_connection_disables_nagle(self):
+        """Test that the TCP connection sends small telegrams immediately."""
+        import socket
+
+        server = socket.create_server(("127.0.0.1", 0))
+        device = THZDevice(
+            connection="ip", host="127.0.0.1", tcp_port=server.getsockname()[1]
+        )
+        try:
+            device._connect_tcp()
+            assert device.ser.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        finally:
+            device.close()
+            server.close()
+
+    def test_tcp_connection_applies_socket_options(self):
+        """Test that configured setsockopt tuples reach the socket."""
+        import socket
+
+        server = socket.create_server(("127.0.0.1", 0))
+        device = THZDevice(
+            connection="ip",
+            host="127.0.0.1",
+            tcp_port=server.getsockname()[1],
+            socket_options=[[socket.SOL_SOCKET, socket.SO_RCVBUF, 8192]],
+        )
+        try:
+            device._connect_tcp()
+            # Linux doubles the requested size for bookkeeping overhead
+            assert device.ser.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 8192
+        finally:
+            device.close()
+            server.close()
+
+    def test_read_available_raises_when_peer_closes(self):
+        """Test that a closed peer is reported as a connection error."""
+        import socket
+
+        device = THZDevice(connection="ip", host="localhost", tcp_port=2000)
+        device.ser, peer = socket.socketpair()
+        peer.close()
+        try:
+            with pytest.raises(ConnectionError):
+                device._read_available(1.0)
+        finally:
+            device.ser.close()
+
+    def test_send_request_reconnects_on_connection_error(self):
+        """Test that a failed write reconnects without probing beforehand."""
+        from unittest.mock import MagicMock, patch
+
+        device = THZDevice(connection="ip", host="localhost", tcp_port=2000)
+        device._initialized = True
+        write_bytes = MagicMock(
+            side_effect=[ConnectionError("reset"), None, None, None]
+        )
+
+        with patch.object(device, "_write_bytes", write_bytes), patch.object(
+            device, "_read_exact", side_effect=[b"\x10", b"\x10\x02"]
+        ), patch.object(device, "_reconnect") as reconnect, patch.object(
+            device, "_is_connection_alive"
+        ) as is_alive:
+            assert device.send_request(b"\x01\x80", "set") == b""
+
+        reconnect.assert_called_once()
+        is_alive.assert_not_called()
+        assert write_bytes.call_count == 4
+
+    def test_reconnect_backs_off_after_failure(self):
+        """Test that failed reconnects are not retried before the delay."""
+        from unittest.mock import patch
+
+        device = THZDevice(connection="ip", host="localhost", tcp_port=2000)
+
+        with patch.object(
+            device, "_connect_tcp", side_effect=OSError("unreachable")
+        ) as connect:
+            with pytest.raises(OSError):
+                device._reconnect()
+            with pytest.raises(ConnectionError, match="backing off"):
+                device._reconnect()
+
+        connect.assert_called_once()
+        assert device._reconnect_failures == 1
+        # First delay is the 0.5 s base with +/-25% jitter
+        assert device._reconnect_not_before > 0
+
+
+class TestTHZDeviceWriteQueue:
+    """Tests for writes submitted through the device write worker."""
+
+    def test_concurrent_writes_are_batched(self):
+        """Test that writes queued together share one executor job."""
+        import asyncio
+        from unittest.mock import patch
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+        writes = []
+
+        async def run():
+            with patch.object(
+                device, "write_value", side_effect=lambda a, v: writes.append((a, v))
+            ), patch.object(
+                device, "_write_batch", wraps=device._write_batch
+            ) as write_batch:
+                await asyncio.gather(
+                    device.submit_write(b"\x0a", b"\x01"),
+                    device.submit_write(b"\x0b", b"\x00"),
+                    device.submit_write(b"\x0c", b"\x01"),
+                )
+                await device.async_stop_write_worker()
+                return write_batch.call_count
+
+        assert asyncio.run(run()) == 1
+        assert writes == [(b"\x0a", b"\x01"), (b"\x0b", b"\x00"), (b"\x0c", b"\x01")]
+
+    def test_write_error_is_raised_to_its_caller(self):
+        """Test that a failing write only fails its own submit_write call."""
+        import asyncio
+        from unittest.mock import patch
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+
+        def write_value(addr_bytes, value):
+            if addr_bytes == b"\x0b":
+                raise ValueError("bad write")
+
+        async def run():
+            with patch.object(device, "write_value", side_effect=write_value):
+                results = await asyncio.gather(
+                    device.submit_write(b"\x0a", b"\x01"),
+                    device.submit_write(b"\x0b", b"\x01"),
+                    return_exceptions=True,
+                )
+                await device.async_stop_write_worker()
+                return results
+
+        first, second = asyncio.run(run())
+        assert first is None
+        assert isinstance(second, ValueError)
+
+    def test_batch_failure_fails_every_write_and_worker_survives(self):
+        """Test that an error outside write_value fails the whole batch."""
+        import asyncio
+        from unittest.mock import patch
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+
+        async def run():
+            with patch.object(
+                device, "_write_batch", side_effect=OSError("executor gone")
+            ):
+                results = await asyncio.gather(
+                    device.submit_write(b"\x0a", b"\x01"),
+                    device.submit_write(b"\x0b", b"\x01"),
+                    return_exceptions=True,
+                )
+            worker_alive = not device._write_worker.done()
+            with patch.object(device, "write_value"):
+                await device.submit_write(b"\x0c", b"\x01")
+            await device.async_stop_write_worker()
+            return results, worker_alive
+
+        results, worker_alive = asyncio.run(run())
+        assert all(isinstance(result, OSError) for result in results)
+        assert worker_alive
+
+    def test_write_after_close_is_refused(self):
+        """Test that submit_write does not start a new worker once closed."""
+        import asyncio
+        from unittest.mock import patch
+
+        device = THZDevice(connection="usb", port="/dev/ttyUSB0")
+
+        async def run():
+            with patch.object(device, "close"):
+                await device.async_close()
+            with pytest.raises(RuntimeError):
+                await device.submit_write(b"\x0a", b"\x01")
+
+        asyncio.run(run())
+        assert device._write_worker is None
+
+
 class TestTHZDeviceCaching:
     """Tests for cache functionality."""
 
@@ -108,7 +489,7 @@ class TestTHZDeviceCaching:
         block = b'\x01\x00'
         data = b'\xaa\xbb\xcc'
         
-        device._cache[block] = (time.time(), data)
+        device._cache[block] = (time.monotonic(), data)
         
         assert block in device._cache
         assert device._cache[block][1] == data
@@ -122,7 +503,7 @@ class TestTHZDeviceCaching:
         data = b'\xaa\xbb\xcc'
         
         # Store fresh data in cache
-        device._cache[block] = (time.time(), data)
+        device._cache[block] = (time.monotonic(), data)
         
         # Should return cached data
         result = device.read_block_cached(block, cache_duration=60)
@@ -137,13 +518,38 @@ class TestTHZDeviceCaching:
         data = b'\xaa\xbb\xcc'
         
         # Store old data in cache (100 seconds ago)
-        device._cache[block] = (time.time() - 100, data)
+        device._cache[block] = (time.monotonic() - 100, data)
         
         # Should not return expired data (with 60 second duration)
         # Without actual connection, should raise an exception
         with pytest.raises((ConnectionError, RuntimeError)):
             device.read_block_cached(block, cache_duration=60)
 
+    def test_read_block_cached_uses_block_ttl(self):
+        """Test that a block's own lifetime overrides the default."""
+        import time
+
+        device = THZDevice(connection="usb", port="/dev/null")
+        block = b'\x01\x00'
+        data = b'\xaa\xbb\xcc'
+        device._cache[block] = (time.monotonic() - 100, data)
+
+        device.set_cache_ttl(block, float("inf"))
+        assert device.read_block_cached(block) == data
+
+    def test_write_invalidates_cache(self):
+        """Test that writing a value drops all cached blocks."""
+        import time
+        from unittest.mock import patch
+
+        device = THZDevice(connection="usb", port="/dev/null")
+        device._cache[b'\x01\x00'] = (time.monotonic(), b'\xaa')
+
+        with patch.object(device, "read_write_register"):
+            device.write_value(b'\x0a\x01', b'\x00\x01')
+
+        assert device._cache == {}
+
 
 class TestTHZDeviceProtocol:
     """Tests for protocol utility functions."""
@@ -250,6 +656,36 @@ class TestTHZDeviceProtocol:
         # After escaping: b'\x20\x10\x10'
         assert telegram == b'\x01\x00\x20\x10\x10\x10\x03'
 
+    def test_get_telegram_built_once_per_address(self):
+        """Test that repeated reads reuse the telegram of an address."""
+        from unittest.mock import patch
+
+        device = THZDevice(connection="usb", port="/dev/null")
+        response = b'\x01\x00\xfc\xfb\x10\x03'
+
+        with patch.object(
+            device, "send_request", return_value=response
+        ) as send_request, patch.object(
+            device, "construct_telegram", wraps=device.construct_telegram
+        ) as construct:
+            device.read_write_register(b'\xfb', "get")
+            device.read_write_register(b'\xfb', "get")
+            device.read_write_register(b'\x0a', "set", b'\x00\x01')
+
+        assert construct.call_count == 2
+        first, second, _ = (c.args[0] for c in send_request.call_args_list)
+        assert first is second
+
+    def test_prebuilt_get_telegrams_match_built_ones(self):
+        """Test that prebuilt telegrams equal the ones built on demand."""
+        device = THZDevice(connection="usb", port="/dev/null")
+        device.prebuild_get_telegrams([b'\xfb', b'\x0a\x01\x16'])
+
+        assert device._get_telegrams == {
+            b'\xfb': device._build_telegram(b'\xfb', "get", b""),
+            b'\x0a\x01\x16': device._build_telegram(b'\x0a\x01\x16', "get", b""),
+        }
+
 
 class TestFirmwareVersion:
     """Tests for firmware version property."""
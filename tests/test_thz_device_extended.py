@@ -172,8 +172,8 @@ class TestTHZDeviceCacheAdvanced:
         data2 = b'\xcc\xdd'
         
         # Store in cache
-        device._cache[block1] = (time.time(), data1)
-        device._cache[block2] = (time.time(), data2)
+        device._cache[block1] = (time.monotonic(), data1)
+        device._cache[block2] = (time.monotonic(), data2)
         
         # Verify both cached
         result1 = device.read_block_cached(block1, cache_duration=60)
@@ -189,7 +189,7 @@ class TestTHZDeviceCacheAdvanced:
         data = b'\xaa\xbb'
         
         # Store with timestamp exactly at duration boundary
-        now = time.time()
+        now = time.monotonic()
         device._cache[block] = (now - 60, data)
         
         # With duration of 60, should be expired
@@ -203,7 +203,7 @@ class TestTHZDeviceCacheAdvanced:
         data = b'\xaa\xbb'
         
         # Store with timestamp just within duration
-        now = time.time()
+        now = time.monotonic()
         device._cache[block] = (now - 59, data)
         
         # With duration of 60, should still be valid
@@ -217,7 +217,7 @@ class TestTHZDeviceCacheAdvanced:
         data = b'\xaa\xbb'
         
         # Store fresh data
-        device._cache[block] = (time.time(), data)
+        device._cache[block] = (time.monotonic(), data)
         
         # With zero duration, should be expired
         result = device.read_block_cached(block, cache_duration=0)
@@ -230,7 +230,7 @@ class TestTHZDeviceCacheAdvanced:
         data = b'\xaa\xbb'
         
         # Store old data
-        device._cache[block] = (time.time() - 1000, data)
+        device._cache[block] = (time.monotonic() - 1000, data)
         
         # With very long duration, should still be valid
         result = device.read_block_cached(block, cache_duration=10000)
@@ -185,3 +185,35 @@ class TestTimeValidation:
                 t = time(hour, minute)
                 quarters = time_to_quarters(t)
                 assert 0 <= quarters <= 95, f"Invalid quarters {quarters} for {hour}:{minute}"
+
+
+class TestParseHHMM:
+    """Test parsing of "HH:MM" strings."""
+
+    def test_parse_valid_strings(self):
+        """Test that HH:MM and HH:MM:SS strings are split into hour and minute."""
+        from custom_components.thz.time import _parse_hhmm
+
+        assert _parse_hhmm("00:00") == (0, 0)
+        assert _parse_hhmm("12:30") == (12, 30)
+        assert _parse_hhmm("23:59:00") == (23, 59)
+        assert _parse_hhmm("9:00") == (9, 0)
+        assert _parse_hhmm("9:05:30") == (9, 5)
+
+    def test_parse_invalid_strings(self):
+        """Test that malformed or out-of-range strings raise ValueError."""
+        from custom_components.thz.time import _parse_hhmm
+
+        for value in (
+            "1230",
+            "12-30",
+            "24:00",
+            "12:60",
+            "ab:cd",
+            "12:30x00",
+            "9:0",
+            ":30",
+            "",
+        ):
+            with pytest.raises(ValueError):
+                _parse_hhmm(value)